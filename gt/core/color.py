@@ -362,9 +362,7 @@ def set_color_outliner(obj_list, rgb_color=(1, 1, 1)):
         try:
             if cmds.objExists(str(obj)) and cmds.getAttr(f"{obj}.useOutlinerColor", lock=True) is False:
                 cmds.setAttr(f"{obj}.useOutlinerColor", 1)
-                cmds.setAttr(f"{obj}.outlinerColorR", rgb_color[0])
-                cmds.setAttr(f"{obj}.outlinerColorG", rgb_color[1])
-                cmds.setAttr(f"{obj}.outlinerColorB", rgb_color[2])
+                cmds.setAttr(f"{obj}.outlinerColor", rgb_color[0], rgb_color[1], rgb_color[2])  # Compound (RGB)
                 result_list.append(str(obj))
         except Exception as e:
             logger.debug(f'Unable to set override outliner color for "{obj}". Issue: {str(e)}')
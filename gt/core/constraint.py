@@ -181,12 +181,12 @@ def equidistant_constraints(start, end, target_list, skip_start_end=True, constr
         list: A list of the created constraints. Empty if something went wrong
     """
     if not target_list:
-        return
-    if target_list and isinstance(target_list, str):
+        return []
+    if isinstance(target_list, str):
         target_list = [target_list]
 
     if skip_start_end:
-        target_list.insert(0, "")  # Skip start point.
+        target_list = [""] + list(target_list)  # Skip start point. (New list, the provided one is not modified)
         steps = 1.0 / len(target_list)  # How much it should increase % by each iteration.
     else:
         steps = 1.0 / (len(target_list) - 1)  # -1 to reach both end point.
@@ -206,9 +206,9 @@ def equidistant_constraints(start, end, target_list, skip_start_end=True, constr
         )
         return []
 
-    # Create Constraints
+    # Create Constraints (Viewport/evaluation suspension is left to the callers, e.g. when building many proxies)
     constraints = []
-    for index, obj in enumerate(target_list):
+    for obj in target_list:
         if obj and cmds.objExists(obj):
             constraints.append(_func(start, obj, weight=1.0 - percentage)[0])
             _func(end, obj, weight=percentage)
@@ -18,6 +18,8 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+_JSON_SCALAR_TYPES = (str, int, float, bool)  # Types that never fail "json.dumps"
+
 
 class DataDirConstants:
     def __init__(self):
@@ -90,7 +92,7 @@ def read_data(path):
         'Hello, world!'
     """
     try:
-        with open(path, "r") as data_file:
+        with open(path, "r", encoding="utf-8") as data_file:
             data = data_file.read()
         return data
     except FileNotFoundError:
@@ -426,6 +428,8 @@ def is_json_serializable(data, allow_none=True):
     """
     if data is None and allow_none is False:
         return False
+    if data is None or type(data) in _JSON_SCALAR_TYPES:  # Always serializable, skip encoding
+        return True
     try:
         json.dumps(data)
         return True
@@ -89,6 +89,54 @@ def duplicate_joint_for_automation(
     return jnt_as_node
 
 
+def duplicate_joint_chain_for_automation(
+    joints, suffix=core_naming.NamingConstants.Suffix.DRIVEN, parent=None, connect_rot_order=True
+):
+    """
+    Batched version of the "duplicate_joint_for_automation" function.
+    Duplicates all provided joints with a single "duplicate" call (parent only, so descendants are not copied)
+    and chains them in the provided order. e.g. [hip, spine, chest] -> parent > hip > spine > chest
+    Args:
+        joints (list): A list of joints to be duplicated (in chain order). Missing joints are ignored.
+        suffix (str, optional): The suffix to be added at the end of the duplicated joints.
+        parent (str, optional): If provided, and it exists, the first duplicated joint will be parented to this object.
+        connect_rot_order (bool, optional): If True, it will create a connection between the original joints rotate
+                                            order and the duplicated joints rotate order.
+                                            (duplicate receives from original)
+    Returns:
+        list: A list of nodes (that have a str as base) of the duplicated joints, in the same order as "joints".
+    """
+    joints = [jnt for jnt in joints or [] if jnt and cmds.objExists(str(jnt))]
+    if not joints:
+        return []
+    # Store Selection
+    selection = cmds.ls(selection=True) or []
+    # Duplicate (Single Call)
+    duplicates = cmds.duplicate([str(jnt) for jnt in joints], parentOnly=True, inputConnections=False)
+    duplicates = [core_node.Node(dup) for dup in duplicates]
+    core_attr.delete_user_defined_attrs(obj_list=duplicates, delete_locked=True, verbose=False)
+    core_attr.set_attr_state(obj_list=duplicates, attr_list=core_attr.DEFAULT_ATTRS, locked=False, hidden=False)
+    # Rename, Connect and Chain
+    last_parent = parent if parent and cmds.objExists(str(parent)) else None
+    for jnt, dup in zip(joints, duplicates):
+        dup.rename(f"{core_naming.get_short_name(jnt)}_{suffix}")
+        if connect_rot_order:
+            core_attr.connect_attr(source_attr=f"{str(jnt)}.rotateOrder", target_attr_list=f"{dup}.rotateOrder")
+        if last_parent:
+            core_hrchy.parent(source_objects=dup, target_parent=last_parent)
+        elif cmds.listRelatives(dup, parent=True):
+            cmds.parent(dup, world=True)
+        last_parent = dup
+    # Manage Selection
+    cmds.select(clear=True)
+    if selection:
+        try:
+            cmds.select(selection)
+        except Exception as e:
+            logger.debug(f"Unable to restore previous selection. Issue: {e}")
+    return duplicates
+
+
 def rescale_joint_radius(joint_list, multiplier, initial_value=None):
     """
     Re-scales the joint radius attribute of the provided joints.
@@ -586,15 +586,15 @@ class Transform:
             if rotation and len(rotation) == 3:
                 self.set_rotation(xyz=rotation)
         else:
-            position = core_attr.get_multiple_attr(obj_list=[obj_name], attr_list=["tx", "ty", "tz"], verbose=False)
-            if position and len(position) == 3:
-                self.set_position(xyz=list(position.values()))
-            rotation = core_attr.get_multiple_attr(obj_list=[obj_name], attr_list=["rx", "ry", "rz"], verbose=False)
-            if rotation and len(rotation) == 3:
-                self.set_rotation(xyz=list(rotation.values()))
-        scale = core_attr.get_multiple_attr(obj_list=[obj_name], attr_list=["sx", "sy", "sz"], verbose=False)
-        if scale and len(scale) == 3:
-            self.set_scale(xyz=list(scale.values()))
+            position = _get_double3_attr(f"{obj_name}.translate")
+            if position:
+                self.set_position(xyz=position)
+            rotation = _get_double3_attr(f"{obj_name}.rotate")
+            if rotation:
+                self.set_rotation(xyz=rotation)
+        scale = _get_double3_attr(f"{obj_name}.scale")
+        if scale:
+            self.set_scale(xyz=scale)
 
         return self
 
@@ -645,9 +645,12 @@ class Transform:
                 relative=relative,
                 objectSpace=object_space,
             )
-            core_attr.set_attr(attribute_path=f"{target_object}.sx", value=self.scale.x)
-            core_attr.set_attr(attribute_path=f"{target_object}.sy", value=self.scale.y)
-            core_attr.set_attr(attribute_path=f"{target_object}.sz", value=self.scale.z)
+            try:  # Single call for all channels, falls back to one channel at a time (e.g. partially locked scale)
+                cmds.setAttr(f"{target_object}.scale", self.scale.x, self.scale.y, self.scale.z)
+            except Exception:
+                core_attr.set_attr(attribute_path=f"{target_object}.sx", value=self.scale.x)
+                core_attr.set_attr(attribute_path=f"{target_object}.sy", value=self.scale.y)
+                core_attr.set_attr(attribute_path=f"{target_object}.sz", value=self.scale.z)
         else:
             position = self.position.get_as_tuple()
             rotation = self.rotation.get_as_tuple()
@@ -704,6 +707,23 @@ class Transform:
 
 
 # ------------------------------------------------- Utilities Start -----------------------------------------------
+def _get_double3_attr(attribute_path):
+    """
+    Gets the three values of a compound attribute (e.g. "translate") using a single "getAttr" call.
+    Args:
+        attribute_path (str): Full path to the compound attribute. e.g. "pCube1.scale"
+    Returns:
+        list or None: The three values. e.g. [1.0, 1.0, 1.0] - None if the attribute couldn't be read.
+    """
+    try:
+        value = cmds.getAttr(attribute_path)
+    except Exception as e:
+        logger.debug(f'Unable to get values from "{attribute_path}". Issue: {str(e)}')
+        return None
+    if value and len(value) == 1 and len(value[0]) == 3:
+        return list(value[0])
+
+
 def move_pivot_top():
     """Moves pivot point to the top of the boundary box"""
     selection = cmds.ls(selection=True, long=True)
@@ -7,7 +7,9 @@ Code Namespace:
 
 from gt.core.attr import add_attr, set_attr
 import maya.cmds as cmds
+import functools
 import logging
+import secrets
 import random
 import string
 import uuid
@@ -18,6 +20,10 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Compiled Patterns
+_UUID_RE = re.compile(r"^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$")
+_UUID_ANY_RE = re.compile(r"^(?:[0-9a-z]+|[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12})$")
+
 
 def generate_uuid(short=False, short_length=8, remove_dashes=False):
     """
@@ -58,15 +64,14 @@ def generate_uuid(short=False, short_length=8, remove_dashes=False):
         generate_uuid(short=True, short_length=6)
         '2e96b4'
     """
-    _uuid = str(uuid.uuid4())
     if short and short_length <= 0:
         raise ValueError("Length must be a positive integer")
     if short:
         alphabet = string.ascii_lowercase + string.digits
-        _uuid = "".join(random.choices(alphabet, k=short_length))
+        return "".join(random.choices(alphabet, k=short_length))
     if remove_dashes:
-        _uuid = _uuid.replace("-", "")
-    return _uuid
+        return secrets.token_hex(16)  # Same 32 hex characters format, without creating and formatting a UUID object
+    return str(uuid.uuid4())
 
 
 def is_uuid_valid(uuid_string):
@@ -79,9 +84,7 @@ def is_uuid_valid(uuid_string):
     Returns:
         bool: True if the UUID is valid, False otherwise.
     """
-    # uuid_pattern = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
-    uuid_pattern = re.compile(r"^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$")
-    return bool(uuid_pattern.match(uuid_string))
+    return bool(_UUID_RE.match(uuid_string))
 
 
 def is_short_uuid_valid(uuid_string, length=None):
@@ -102,6 +105,37 @@ def is_short_uuid_valid(uuid_string, length=None):
     return all(c in valid_characters for c in uuid_string)
 
 
+def is_uuid_valid_any(uuid_string):
+    """
+    Check if a given string is either a valid UUID (with or without dashes) or a valid short UUID.
+    Same result as "is_uuid_valid(uuid_string) or is_short_uuid_valid(uuid_string)" using a single pattern match.
+    Recent results are remembered, so repeated checks (e.g. a parent referenced by many children) skip the match.
+
+    Args:
+        uuid_string (str): The UUID string to be checked.
+
+    Returns:
+        bool: True if the UUID is valid (full or short), False otherwise.
+    """
+    if not uuid_string or not isinstance(uuid_string, str):
+        return False
+    return _matches_uuid_any(uuid_string)
+
+
+@functools.lru_cache(maxsize=1024)
+def _matches_uuid_any(uuid_string):
+    """
+    Checks a string against the full or short UUID pattern. Results are cached (bounded to the most recent strings).
+
+    Args:
+        uuid_string (str): The UUID string to be checked.
+
+    Returns:
+        bool: True if the string matches the pattern, False otherwise.
+    """
+    return bool(_UUID_ANY_RE.match(uuid_string))
+
+
 def get_object_from_uuid_attr(uuid_string, attr_name, obj_type="transform"):
     """
     Return object if provided UUID is present in it
@@ -158,7 +192,7 @@ def get_object_from_uuid(uuid_string):
         return None
 
 
-def add_uuid_attr(obj_list, attr_name, set_initial_uuid_value=True):
+def add_uuid_attr(obj_list, attr_name, set_initial_uuid_value=True, uuid_value=None):
     """
     Adds an uuid attribute to a list of objects or a single object.
 
@@ -171,6 +205,8 @@ def add_uuid_attr(obj_list, attr_name, set_initial_uuid_value=True):
         attr_name (str): The name of the proxy attribute to be added to the objects.
         set_initial_uuid_value (bool, optional): Whether to set an initial UUID value for the proxy attribute.
                                                  Default is True. The generated UUID is uuid4 without dashes.
+        uuid_value (str, optional): If provided, this value is used as the initial value of every created attribute
+                                    instead of a generated UUID. (Ignores "set_initial_uuid_value")
 
     Returns:
         list: A list of created proxy attribute paths.
@@ -188,6 +224,10 @@ def add_uuid_attr(obj_list, attr_name, set_initial_uuid_value=True):
     if isinstance(obj_list, str):
         obj_list = [obj_list]
     created_attrs = add_attr(obj_list=obj_list, attributes=attr_name, attr_type="string", verbose=False)
+    if uuid_value is not None:
+        for attr in created_attrs:
+            set_attr(attribute_path=attr, value=uuid_value)
+        return created_attrs
     for attr in created_attrs:
         set_attr(attribute_path=attr, value="")
     if set_initial_uuid_value:
@@ -26,6 +26,13 @@ PACKAGE_TAGS_URL = f"{PACKAGE_RELEASES_URL}/tags/"
 VERSION_BIGGER = 1
 VERSION_SMALLER = -1
 VERSION_EQUAL = 0
+_SEMANTIC_VERSION_PATTERN = re.compile(r"^(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)$")
+_SEMANTIC_VERSION_METADATA_PATTERN = re.compile(
+    r"^(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)(?:-((?:0|[1-9][0-9]*|[0-9]*[a-zA-Z-]"
+    r"[0-9a-zA-Z-]*)(?:\.(?:0|[1-9][0-9]*|[0-9]*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+"
+    r"(?:\.[0-9a-zA-Z-]+)*))?$"
+)
+_NON_VERSION_CHARACTERS_PATTERN = re.compile(r"[^\d.]")
 
 
 def is_semantic_version(version_str, metadata_ok=True):
@@ -47,15 +54,8 @@ def is_semantic_version(version_str, metadata_ok=True):
         is_semantic_version("1.3.4-alpha", metadata_ok=True)  # True
     """
 
-    if metadata_ok:
-        pattern = (
-            r"^(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)(?:-((?:0|[1-9][0-9]*|[0-9]*[a-zA-Z-]"
-            r"[0-9a-zA-Z-]*)(?:\.(?:0|[1-9][0-9]*|[0-9]*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+"
-            r"(?:\.[0-9a-zA-Z-]+)*))?$"
-        )
-    else:
-        pattern = r"^(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)$"
-    return bool(re.match(pattern, str(version_str)))
+    pattern = _SEMANTIC_VERSION_METADATA_PATTERN if metadata_ok else _SEMANTIC_VERSION_PATTERN
+    return bool(pattern.match(str(version_str)))
 
 
 def parse_semantic_version(version_string, as_tuple=False):
@@ -74,7 +74,7 @@ def parse_semantic_version(version_string, as_tuple=False):
                            e.g. (major=1, minor=2, patch=3)
     """
     try:
-        version_string = re.sub("[^\d.]", "", version_string)  # Remove non-digits (keeps ".")
+        version_string = _NON_VERSION_CHARACTERS_PATTERN.sub("", version_string)  # Remove non-digits (keeps ".")
         major, minor, patch = map(int, version_string.split(".")[:3])
         if as_tuple:
             return SemanticVersion(major=major, minor=minor, patch=patch)
@@ -96,20 +96,11 @@ def compare_versions(version_a, version_b):
              0: if equal,
              1: if newer ("A" newer than "B")
     """
-    major_a, minor_a, patch_a = parse_semantic_version(version_a, as_tuple=True)
-    major_b, minor_b, patch_b = parse_semantic_version(version_b, as_tuple=True)
-
-    if major_a > major_b:
-        return VERSION_BIGGER
-    elif major_a < major_b:
-        return VERSION_SMALLER
-    elif minor_a > minor_b:
-        return VERSION_BIGGER
-    elif minor_a < minor_b:
-        return VERSION_SMALLER
-    elif patch_a > patch_b:
+    parsed_a = parse_semantic_version(version_a, as_tuple=True)
+    parsed_b = parse_semantic_version(version_b, as_tuple=True)
+    if parsed_a > parsed_b:  # Tuples compare major, then minor, then patch
         return VERSION_BIGGER
-    elif patch_a < patch_b:
+    elif parsed_a < parsed_b:
         return VERSION_SMALLER
     else:
         return VERSION_EQUAL
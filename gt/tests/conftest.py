@@ -0,0 +1,29 @@
+"""
+Pytest Configuration - Only used when running the tests through pytest (not used by "run_all_tests_with_summary")
+Tests marked as "maya" are pinned to a single "pytest-xdist" worker, while "qt" (mocked) tests can be distributed.
+e.g. "pytest -n auto --dist=loadgroup"
+"""
+
+import pytest
+
+
+def pytest_configure(config):
+    """
+    Registers the custom markers used by the package tests.
+    Args:
+        config (pytest.Config): Pytest configuration object.
+    """
+    config.addinivalue_line("markers", "maya: test requires a Maya session (runs in a single worker)")
+    config.addinivalue_line("markers", "qt: test only requires Qt (can run in parallel)")
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Groups all tests marked as "maya" under the same "xdist_group", so they run in a single worker.
+    Args:
+        config (pytest.Config): Pytest configuration object.
+        items (list): List of collected test items.
+    """
+    for item in items:
+        if item.get_closest_marker("maya") is not None:
+            item.add_marker(pytest.mark.xdist_group("maya"))
@@ -39,3 +39,14 @@ class TestModuleSpine(unittest.TestCase):
         result = isinstance(a_spine_module, tools_rig_frm.ModuleGeneric)
         expected = True
         self.assertEqual(expected, result)
+
+    def test_set_spine_num_proxy_uuids(self):
+        a_spine_module = tools_mod_spine.ModuleSpine()
+        a_valid_uuid = "550e8400-e29b-41d4-a716-446655440000"
+        a_spine_module.set_spine_num(0)
+        a_spine_module.set_spine_num(2, proxy_uuids={"spine01": a_valid_uuid})
+        result = a_spine_module.spine_proxies[0].get_uuid()
+        expected = a_valid_uuid
+        self.assertEqual(expected, result)
+        result = a_spine_module.spine_proxies[1].get_parent_uuid()
+        self.assertEqual(expected, result)
@@ -346,6 +346,18 @@ class TestRigFramework(unittest.TestCase):
         }
         self.assertEqual(expected, result)
 
+    def test_proxy_get_proxy_as_dict_cache_invalidation(self):
+        self.proxy.set_name(name="mocked_name_one")
+        first_result = self.proxy.get_proxy_as_dict()
+        first_result["name"] = "modified_outside"  # Returned dictionary is a copy
+        self.assertEqual("mocked_name_one", self.proxy.get_proxy_as_dict().get("name"))
+        self.proxy.set_name(name="mocked_name_two")
+        self.proxy.set_position(1, 2, 3)
+        result = self.proxy.get_proxy_as_dict()
+        self.assertEqual("mocked_name_two", result.get("name"))
+        expected = self.proxy.transform.get_transform_as_dict()
+        self.assertEqual(expected, result.get("transform"))
+
     def test_proxy_set_name(self):
         self.proxy.set_name("mocked_proxy_name")
         result = self.proxy.get_name()
@@ -671,6 +683,29 @@ class TestRigFramework(unittest.TestCase):
         expected_dictionary = mocked_dict
         self.assertEqual(expected_dictionary, result)
 
+    def test_proxy_read_data_from_dict_offset_transform(self):
+        mocked_dict = {
+            "transform": {"position": (1, 2, 3), "rotation": (0, 0, 0), "scale": (1, 1, 1)},
+            "offsetTransform": {"position": (4, 5, 6), "rotation": (0, 0, 0), "scale": (1, 1, 1)},
+        }
+        self.proxy.read_data_from_dict(mocked_dict)
+        expected = core_trans.Transform(position=(1, 2, 3))
+        self.assertEqual(expected, self.proxy.transform)
+        expected = core_trans.Transform(position=(4, 5, 6))
+        self.assertEqual(expected, self.proxy.offset_transform)
+
+    def test_proxy_from_dict_fast(self):
+        self.proxy.set_initial_position(xyz=(1, 2, 3))
+        self.proxy.set_parent_uuid(self.a_valid_uuid)
+        self.proxy.set_meta_purpose("mocked_purpose")
+        proxy_dict = self.proxy.get_proxy_as_dict()
+        fast_proxy = tools_rig_frm.Proxy._from_dict_fast(proxy_dict=proxy_dict, uuid=self.proxy.get_uuid())
+        validated_proxy = tools_rig_frm.Proxy(uuid=self.proxy.get_uuid())
+        validated_proxy.read_data_from_dict(proxy_dict)
+        expected = validated_proxy.get_proxy_as_dict(include_uuid=True)
+        result = fast_proxy.get_proxy_as_dict(include_uuid=True)
+        self.assertEqual(expected, result)
+
     # --------------------------------------------- ModuleGeneric ---------------------------------------------
     def test_module_set_proxies(self):
         a_1st_proxy = tools_rig_frm.Proxy(name="a_1st_proxy")
@@ -742,6 +777,21 @@ class TestRigFramework(unittest.TestCase):
         expected = "mocked_suffix"
         self.assertEqual(expected, result)
 
+    def test_module_get_module_class_name(self):
+        class ModuleMockedSubclass(tools_rig_frm.ModuleGeneric):
+            pass
+
+        cases = [
+            (self.module, {}, "ModuleGeneric"),
+            (self.module, {"remove_module_prefix": True}, "Generic"),
+            (ModuleMockedSubclass(), {}, "ModuleMockedSubclass"),
+            (ModuleMockedSubclass(), {"remove_module_prefix": True}, "MockedSubclass"),
+            (ModuleMockedSubclass(), {"formatted": True}, "Module Mocked Subclass"),
+        ]
+        for module, kwargs, expected in cases:
+            with self.subTest(module=module.__class__.__name__, kwargs=kwargs):
+                self.assertEqual(expected, module.get_module_class_name(**kwargs))
+
     def test_module_read_data_from_scene(self):
         a_proxy_one = tools_rig_frm.Proxy(name="a_proxy_one")
         a_proxy_two = tools_rig_frm.Proxy(name="a_proxy_two")
@@ -812,6 +862,25 @@ class TestRigFramework(unittest.TestCase):
         }
         self.assertEqual(expected, result)
 
+    def test_project_get_active_modules(self):
+        a_1st_module = tools_rig_frm.ModuleGeneric()
+        a_2nd_module = tools_rig_frm.ModuleGeneric()
+        a_2nd_module.set_active_state(is_active=False)
+        self.project.add_to_modules([a_1st_module, a_2nd_module])
+        result = self.project.get_active_modules()
+        expected = [a_1st_module]
+        self.assertEqual(expected, result)
+
+    def test_project_get_modules_by_proxy_uuid(self):
+        a_1st_module = tools_rig_frm.ModuleGeneric()
+        a_2nd_module = tools_rig_frm.ModuleGeneric()
+        a_1st_proxy = a_1st_module.add_new_proxy()
+        a_2nd_proxy = a_2nd_module.add_new_proxy()
+        self.project.add_to_modules([a_1st_module, a_2nd_module])
+        result = self.project.get_modules_by_proxy_uuid()
+        expected = {a_1st_proxy.get_uuid(): a_1st_module, a_2nd_proxy.get_uuid(): a_2nd_module}
+        self.assertEqual(expected, result)
+
     def test_project_build_proxy_check_elements(self):
         a_proxy = tools_rig_frm.Proxy()
         a_module = tools_rig_frm.ModuleGeneric()
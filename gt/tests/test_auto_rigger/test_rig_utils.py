@@ -80,6 +80,40 @@ class TestRigUtils(unittest.TestCase):
         result = tools_rig_utils.find_proxy_from_uuid(uuid_string=unused_uuid)
         self.assertEqual(expected, result)
 
+    def test_find_proxy_from_uuid_scene_lookup_cache(self):
+        a_valid_uuid = "550e8400-e29b-41d4-a716-446655440000"
+        a_generic_module = tools_rig_frm.ModuleGeneric()
+        a_proxy = a_generic_module.add_new_proxy()
+        a_proxy.set_uuid(a_valid_uuid)
+        a_generic_module.build_proxy()
+
+        expected = tools_rig_utils.find_proxy_from_uuid(uuid_string=a_valid_uuid)
+        with tools_rig_utils.SceneLookupCache():
+            result = tools_rig_utils.find_proxy_from_uuid(uuid_string=a_valid_uuid)
+            self.assertEqual(expected, result)
+            cmds.duplicate(str(result))  # Same UUID, first proxy found is kept
+            result = tools_rig_utils.find_proxy_from_uuid(uuid_string=a_valid_uuid)
+            self.assertEqual(expected, result)
+
+    def test_get_proxies_by_uuid(self):
+        a_1st_valid_uuid = "550e8400-e29b-41d4-a716-446655440000"
+        a_2nd_valid_uuid = "631b5e34-58af-48c3-80e0-c41fe7a56470"
+        a_generic_module = tools_rig_frm.ModuleGeneric()
+        a_1st_proxy = a_generic_module.add_new_proxy()
+        a_2nd_proxy = a_generic_module.add_new_proxy()
+        a_1st_proxy.set_name("firstProxy")
+        a_2nd_proxy.set_name("secondProxy")
+        a_1st_proxy.set_uuid(a_1st_valid_uuid)
+        a_2nd_proxy.set_uuid(a_2nd_valid_uuid)
+        a_generic_module.build_proxy()
+
+        result = tools_rig_utils.get_proxies_by_uuid()
+        expected = {
+            a_1st_valid_uuid: "|firstProxy_offset|firstProxy",
+            a_2nd_valid_uuid: "|secondProxy_offset|secondProxy",
+        }
+        self.assertEqual(expected, result)
+
     def test_find_joint_from_uuid(self):
         a_1st_valid_uuid = "550e8400-e29b-41d4-a716-446655440000"
         a_2nd_valid_uuid = "631b5e34-58af-48c3-80e0-c41fe7a56470"
@@ -113,6 +147,26 @@ class TestRigUtils(unittest.TestCase):
         result = tools_rig_utils.find_joint_from_uuid(uuid_string=unused_uuid)
         self.assertEqual(expected, result)
 
+    def test_get_joints_by_uuid(self):
+        a_1st_valid_uuid = "550e8400-e29b-41d4-a716-446655440000"
+        a_2nd_valid_uuid = "631b5e34-58af-48c3-80e0-c41fe7a56470"
+        a_generic_module = tools_rig_frm.ModuleGeneric()
+        a_1st_proxy = a_generic_module.add_new_proxy()
+        a_2nd_proxy = a_generic_module.add_new_proxy()
+        a_1st_proxy.set_name("firstProxy")
+        a_2nd_proxy.set_name("secondProxy")
+        a_1st_proxy.set_uuid(a_1st_valid_uuid)
+        a_2nd_proxy.set_uuid(a_2nd_valid_uuid)
+        a_generic_module.build_proxy()
+        a_generic_module.build_skeleton_joints()
+
+        result = tools_rig_utils.get_joints_by_uuid()
+        expected = {
+            a_1st_valid_uuid: "|firstProxy_JNT",
+            a_2nd_valid_uuid: "|secondProxy_JNT",
+        }
+        self.assertEqual(expected, result)
+
     def test_find_driver_from_uuid(self):
         a_1st_root_module = tools_mod_root.ModuleRoot()
         a_2nd_root_module = tools_mod_root.ModuleRoot()
@@ -504,6 +558,21 @@ class TestRigUtils(unittest.TestCase):
         result = tools_rig_utils.find_setup_group()
         self.assertEqual(expected, result)
 
+    def test_find_setup_group_scene_lookup_cache(self):
+        a_group = maya_test_tools.create_group(name="a_group")
+        cmds.addAttr(a_group, longName=tools_rig_const.RiggerConstants.REF_ATTR_SETUP, attributeType="bool")
+        with tools_rig_utils.SceneLookupCache():
+            setup_grp = tools_rig_utils.find_setup_group()
+            cmds.parent(a_group, maya_test_tools.create_group(name="b_group"))
+            expected = "|b_group|a_group"
+            result = tools_rig_utils.find_setup_group()
+            self.assertEqual(expected, result)
+            self.assertIs(setup_grp, result)
+        cmds.delete(a_group)
+        expected = None
+        result = tools_rig_utils.find_setup_group()
+        self.assertEqual(expected, result)
+
     def test_find_vis_lines_from_uuid(self):
         a_1st_root_module = tools_mod_root.ModuleRoot()
         a_2nd_root_module = tools_mod_root.ModuleRoot()
@@ -1019,6 +1088,22 @@ class TestRigUtils(unittest.TestCase):
 
         self.assertEqual(expected_offsets, result_offsets)
 
+    def test_get_proxy_offsets(self):
+        a_generic_module = tools_rig_frm.ModuleGeneric()
+        a_1st_proxy = a_generic_module.add_new_proxy()
+        a_2nd_proxy = a_generic_module.add_new_proxy()
+        a_1st_proxy.set_name("firstProxy")
+        a_2nd_proxy.set_name("secondProxy")
+        proxy_data_list = a_generic_module.build_proxy()
+        proxy_paths = [proxy_data.get_long_name() for proxy_data in proxy_data_list]
+
+        expected = ["|firstProxy_offset", "|secondProxy_offset"]
+        result = tools_rig_utils.get_proxy_offsets(proxy_names=proxy_paths)
+        self.assertEqual(expected, result)
+        expected = ["|firstProxy_offset", None]
+        result = tools_rig_utils.get_proxy_offsets(proxy_names=[proxy_paths[0], "missing_proxy"])
+        self.assertEqual(expected, result)
+
     def test_get_meta_purpose_from_dict(self):
         a_generic_module = tools_rig_frm.ModuleGeneric()
         a_1st_proxy = a_generic_module.add_new_proxy()
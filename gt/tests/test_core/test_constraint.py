@@ -209,6 +209,7 @@ class TestConstraintCore(unittest.TestCase):
                                                               constraint='parent')
         expected_constraints = ['pCube3_parentConstraint1', 'pCube4_parentConstraint1', 'pCube5_parentConstraint1']
         self.assertEqual(expected_constraints, constraints)
+        self.assertEqual([cube_one, cube_two, cube_three], targets)  # Provided list is not modified
 
         weight_1 = [0.75, 0.25]
         weight_2 = [0.5, 0.5]
@@ -91,6 +91,32 @@ class TestRiggingCore(unittest.TestCase):
         result = cmds.listConnections(jnt_as_node)
         self.assertEqual(expected, result)
 
+    def test_duplicate_joint_chain_for_automation(self):
+        joint_one = cmds.joint(name="one_jnt")
+        joint_two = cmds.joint(name="two_jnt")
+        cmds.joint(name="three_jnt")  # Child of "two_jnt" (not duplicated)
+        a_group = cmds.group(name="a_group", empty=True, world=True)
+        cmds.addAttr(joint_two, longName="customAttr", attributeType="double")
+
+        result = core_rigging.duplicate_joint_chain_for_automation(
+            joints=[joint_one, joint_two], suffix="mocked", parent=a_group, connect_rot_order=True
+        )
+        expected = ["|a_group|one_jnt_mocked", "|a_group|one_jnt_mocked|two_jnt_mocked"]
+        self.assertEqual(expected, result)
+        expected = [
+            "|a_group|one_jnt_mocked",
+            "|a_group|one_jnt_mocked|two_jnt_mocked",
+            "|one_jnt",
+            "|one_jnt|two_jnt",
+            "|one_jnt|two_jnt|three_jnt",
+        ]
+        result = cmds.ls(typ="joint", long=True)
+        self.assertEqual(expected, result)
+        expected = ["two_jnt"]
+        result = cmds.listConnections("|a_group|one_jnt_mocked|two_jnt_mocked.rotateOrder")
+        self.assertEqual(expected, result)
+        self.assertFalse(cmds.objExists("|a_group|one_jnt_mocked|two_jnt_mocked.customAttr"))
+
     def test_rescale_joint_radius(self):
         joint_one = cmds.joint(name="one_jnt")
         cmds.select(clear=True)
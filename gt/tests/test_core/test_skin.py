@@ -1,4 +1,5 @@
 import unittest
+import pytest
 import logging
 import sys
 import os
@@ -28,25 +29,43 @@ def import_skinned_test_file():
     maya_test_tools.import_data_file("plane_skinned.ma")
 
 
+def create_skin_cluster(joints, geo):
+    """
+    Binds the provided geometry to the joints (to selected bones only) without changing the selection.
+    Args:
+        joints (list): A list of joints to be used as influences.
+        geo (str): The geometry to bind.
+    Returns:
+        str: Name of the created skin cluster.
+    """
+    return cmds.skinCluster(joints, geo, toSelectedBones=True)[0]
+
+
+@pytest.mark.maya
 class TestSkinCore(unittest.TestCase):
     def setUp(self):
-        maya_test_tools.force_new_scene()
+        cmds.undoInfo(openChunk=True, chunkName="test_skin")  # Reverted in tearDown
 
     def tearDown(self):
-        maya_test_tools.delete_test_temp_dir()
+        cmds.undoInfo(closeChunk=True, chunkName="test_skin")
+        cmds.undo()
+        if getattr(self, "_temp_dir_needs_cleanup", False):
+            maya_test_tools.delete_test_temp_dir()
 
     @classmethod
     def setUpClass(cls):
         maya_test_tools.import_maya_standalone(initialize=True)  # Start Maya Headless (mayapy.exe)
+        maya_test_tools.force_new_scene()
+        cmds.undoInfo(state=True, infinity=True)
+        import_skinned_test_file()  # Imported once, changes made by each test are undone in tearDown
+        cmds.flushUndo()
 
     def test_get_skin_cluster(self):
-        import_skinned_test_file()
         result = core_skin.get_skin_cluster("plane")
         expected = "skinCluster1"
         self.assertEqual(expected, result)
 
     def test_get_skin_cluster_missing_item(self):
-        import_skinned_test_file()
         with self.assertRaises(ValueError):
             core_skin.get_skin_cluster("mocked_missing_mesh")
 
@@ -58,24 +77,20 @@ class TestSkinCore(unittest.TestCase):
     #     self.assertEqual(expected, result)
 
     def test_get_influences(self):
-        import_skinned_test_file()
         result = core_skin.get_influences("skinCluster1")
         expected = ["root_jnt", "mid_jnt", "end_jnt"]
         self.assertEqual(expected, result)
 
     def test_get_influences_missing_cluster(self):
-        import_skinned_test_file()
         with self.assertRaises(ValueError):
             core_skin.get_influences("mocked_missing_cluster")
 
     def test_get_bound_joints(self):
-        import_skinned_test_file()
         result = core_skin.get_bound_joints("plane")
         expected = ["root_jnt", "mid_jnt", "end_jnt"]
         self.assertEqual(expected, result)
 
     def test_get_bound_joints_missing_mesh(self):
-        import_skinned_test_file()
         logging.disable(logging.WARNING)
         result = core_skin.get_bound_joints("mocked_missing_mesh")
         logging.disable(logging.NOTSET)
@@ -90,12 +105,10 @@ class TestSkinCore(unittest.TestCase):
     #     self.assertEqual(expected, result)
 
     def test_get_geos_from_skin_cluster_missing_mesh(self):
-        import_skinned_test_file()
         with self.assertRaises(ValueError):
             core_skin.get_geos_from_skin_cluster("mocked_missing_mesh")
 
     def test_get_skin_weights(self):
-        import_skinned_test_file()
         result = core_skin.get_skin_weights("plane")
         expected = {
             0: {"root_jnt": 1.0},
@@ -108,7 +121,6 @@ class TestSkinCore(unittest.TestCase):
         self.assertEqual(expected, result)
 
     def test_set_skin_weights(self):
-        import_skinned_test_file()
         skin_data = {
             0: {"root_jnt": 1.0},
             1: {"root_jnt": 1.0},
@@ -118,15 +130,14 @@ class TestSkinCore(unittest.TestCase):
             5: {"end_jnt": 1.0},
         }
         cmds.delete("skinCluster1")
-        cmds.select(["root_jnt", "mid_jnt", "end_jnt", "plane"])
-        skin_cluster = cmds.skinCluster(tsb=True)[0]
+        skin_cluster = create_skin_cluster(joints=["root_jnt", "mid_jnt", "end_jnt"], geo="plane")
         self.assertTrue(cmds.objExists(skin_cluster))
         core_skin.set_skin_weights("plane", skin_data=skin_data)
         result = core_skin.get_skin_weights("plane")
         self.assertEqual(skin_data, result)
 
     def test_export_skin_weights_to_json(self):
-        import_skinned_test_file()
+        self._temp_dir_needs_cleanup = True
         test_temp_dir = maya_test_tools.generate_test_temp_dir()
         temp_file = os.path.join(test_temp_dir, "temp_file.temp")
         skin_data = {
@@ -142,15 +153,13 @@ class TestSkinCore(unittest.TestCase):
 
             json.dump(skin_data, file)
         cmds.delete("skinCluster1")
-        cmds.select(["root_jnt", "mid_jnt", "end_jnt", "plane"])
-        skin_cluster = cmds.skinCluster(tsb=True)[0]
+        skin_cluster = create_skin_cluster(joints=["root_jnt", "mid_jnt", "end_jnt"], geo="plane")
         self.assertTrue(cmds.objExists(skin_cluster))
         core_skin.import_skin_weights_from_json(target_object="plane", import_file_path=temp_file)
         result = core_skin.get_skin_weights("plane")
         self.assertEqual(skin_data, result)
 
     def test_bind_skin(self):
-        import_skinned_test_file()
         cmds.delete("skinCluster1")
         result = core_skin.bind_skin(joints=["root_jnt", "mid_jnt", "end_jnt"], objects="plane")
         expected = ["skinCluster3"]
@@ -160,7 +169,6 @@ class TestSkinCore(unittest.TestCase):
         self.assertEqual(expected, len(result))
 
     def test_get_python_influences_code(self):
-        import_skinned_test_file()
         result = core_skin.get_python_influences_code(obj_list=["plane", "plane_two"])
         expected = (
             '# Joint influences found in "plane":\n'
@@ -175,7 +183,6 @@ class TestSkinCore(unittest.TestCase):
         self.assertEqual(expected, result)
 
     def test_get_python_influences_code_no_bound_mesh(self):
-        import_skinned_test_file()
         result = core_skin.get_python_influences_code(obj_list=["plane", "plane_two"], include_bound_mesh=False)
         expected = (
             '# Joint influences found in "plane":\n'
@@ -190,7 +197,6 @@ class TestSkinCore(unittest.TestCase):
         self.assertEqual(expected, result)
 
     def test_get_python_influences_code_no_filter(self):
-        import_skinned_test_file()
         result = core_skin.get_python_influences_code(obj_list=["plane", "plane_two"], include_existing_filter=False)
         expected = (
             '# Joint influences found in "plane":\n'
@@ -203,7 +209,6 @@ class TestSkinCore(unittest.TestCase):
         self.assertEqual(expected, result)
 
     def test_selected_get_python_influences_code(self):
-        import_skinned_test_file()
         cmds.select(["plane", "plane_two"])
         result = core_skin.selected_get_python_influences_code()
         expected = (
@@ -219,13 +224,11 @@ class TestSkinCore(unittest.TestCase):
         self.assertEqual(expected, result)
 
     def test_add_influences_to_set(self):
-        import_skinned_test_file()
         result = core_skin.add_influences_to_set(obj_list=["plane", "plane_two"])
         expected = ["plane_influenceSet", "plane_two_influenceSet"]
         self.assertEqual(expected, result)
 
     def test_selected_add_influences_to_set(self):
-        import_skinned_test_file()
         cmds.select(["plane", "plane_two"])
         result = core_skin.selected_add_influences_to_set()
         expected = ["plane_influenceSet", "plane_two_influenceSet"]
@@ -497,6 +497,20 @@ class TestTransformCore(unittest.TestCase):
         expected_scale = core_transform.Vector3(1, 2, 1)
         self.assertEqual(expected_scale, transform.scale)
 
+    def test_set_transform_from_object_object_space(self):
+        cube = maya_test_tools.create_poly_cube()
+        cmds.setAttr(f'{cube}.tx', 3)
+        cmds.setAttr(f'{cube}.rz', 15)
+        cmds.setAttr(f'{cube}.sz', 4)
+        transform = core_transform.Transform()
+        transform.set_transform_from_object(obj_name=cube, world_space=False)
+        expected_position = core_transform.Vector3(3, 0, 0)
+        self.assertEqual(expected_position, transform.position)
+        expected_rotate = core_transform.Vector3(0, 0, 15)
+        self.assertEqual(expected_rotate, transform.rotation)
+        expected_scale = core_transform.Vector3(1, 1, 4)
+        self.assertEqual(expected_scale, transform.scale)
+
     def test_get_position(self):
         transform = core_transform.Transform()
         new_pos = (2, 2, 2)
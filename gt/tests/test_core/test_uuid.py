@@ -122,6 +122,22 @@ class TestUUIDCore(unittest.TestCase):
         result = core_uuid.is_short_uuid_valid(uuid)
         self.assertFalse(result)
 
+    def test_is_uuid_valid_any(self):
+        cases = [
+            ("123e4567-e89b-12d3-a456-426655440000", True),
+            ("123e4567e89b12d3a456426655440000", True),
+            ("abc123", True),
+            ("123e4567-e89b-12d3-a456-42665544000", False),
+            ("not-a-uuid", False),
+            ("abc@123", False),
+            ("ABC123", False),
+            ("", False),
+            (None, False),
+        ]
+        for uuid, expected in cases:
+            with self.subTest(uuid=uuid):
+                self.assertEqual(expected, core_uuid.is_uuid_valid_any(uuid))
+
     def test_add_proxy_attribute(self):
         cube = maya_test_tools.create_poly_cube()
         attr_name = "mockedAttrName"
@@ -167,6 +183,16 @@ class TestUUIDCore(unittest.TestCase):
         mock_generate_uuid.assert_called()
         mock_set_attr.assert_called()
 
+    def test_add_uuid_attr_with_uuid_value(self):
+        cube_one = maya_test_tools.create_poly_cube()
+        cube_two = maya_test_tools.create_poly_cube()
+        attr_name = "mockedAttrName"
+        result = core_uuid.add_uuid_attr([cube_one, cube_two], attr_name, uuid_value="mocked_uuid")
+        expected = [f"{cube_one}.{attr_name}", f"{cube_two}.{attr_name}"]
+        self.assertEqual(expected, result)
+        for attr in result:
+            self.assertEqual("mocked_uuid", cmds.getAttr(attr))
+
     def test_find_object_with_uuid(self):
         cube_one = maya_test_tools.create_poly_cube()
         cube_two = maya_test_tools.create_poly_cube()
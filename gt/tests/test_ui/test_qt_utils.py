@@ -1,6 +1,8 @@
 import gt.ui.qt_import as ui_qt
 from unittest.mock import patch, MagicMock, Mock
+from types import SimpleNamespace
 import unittest
+import pytest
 import logging
 import sys
 import os
@@ -20,7 +22,14 @@ for to_append in [package_root_dir, tests_dir]:
 import gt.ui.qt_utils as ui_qt_utils
 from gt.ui import qt_utils
 
+# Expected Data
+EXPECTED_CUSTOM_FORMATTED_LABEL = (
+    "<html><div style='text-align:left;'><b><font size='16' color='blue' style='background-color:"
+    "yellow;'>Text</font></b><b><font size='14' color='red'>Output</font></b></div></html>"
+)
 
+
+@pytest.mark.qt
 class TestQtUtilities(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -48,8 +57,6 @@ class TestQtUtilities(unittest.TestCase):
 
     @patch("gt.core.session.is_script_in_interactive_maya", MagicMock(return_value=True))
     def test_base_inheritance_widget(self):
-        import gt.ui.qt_import as ui_qt
-
         new_class = ui_qt_utils.MayaWindowMeta(
             name="TestBaseInheritance", bases=(object,), attrs={}, base_inheritance=(ui_qt.QtWidgets.QWidget,)
         )
@@ -107,13 +114,9 @@ class TestQtUtilities(unittest.TestCase):
     @patch.object(ui_qt.QtWidgets.QApplication, "screens")
     def test_get_screen_center(self, mock_screens, mock_get_main_window_screen_number):
         expected = ui_qt.QtCore.QPoint(100, 200)
-        mocked_xy = MagicMock()
-        mocked_xy.x.return_value = 100
-        mocked_xy.y.return_value = 200
-        mocked_center = MagicMock()
-        mocked_center.center.return_value = mocked_xy
-        mocked_geometry = MagicMock()
-        mocked_geometry.geometry.return_value = mocked_center
+        mocked_xy = SimpleNamespace(x=lambda: 100, y=lambda: 200)
+        mocked_center = SimpleNamespace(center=lambda: mocked_xy)
+        mocked_geometry = SimpleNamespace(geometry=lambda: mocked_center)
         mock_screens.return_value = [mocked_geometry]
         result = qt_utils.get_screen_center()
         self.assertEqual(expected, result)
@@ -155,10 +158,13 @@ class TestQtUtilities(unittest.TestCase):
 
         self.assertEqual(font, expected_font)
 
-    @patch("gt.ui.qt_utils.is_font_available", return_value=False)
-    @patch("gt.ui.qt_utils.load_custom_font", return_value=ui_qt.QtGui.QFont("CustomFont"))
+    @patch.multiple(
+        "gt.ui.qt_utils",
+        is_font_available=MagicMock(return_value=False),
+        load_custom_font=MagicMock(return_value=ui_qt.QtGui.QFont("CustomFont")),
+    )
     @patch("gt.ui.qt_import.QtWidgets.QApplication.instance")
-    def test_get_font_with_font_path(self, mock_instance, mock_load_custom_font, mock_is_font_available):
+    def test_get_font_with_font_path(self, mock_instance):
         mock_instance.return_value = MagicMock()
         import gt.ui.resource_library as ui_res_lib
 
@@ -177,44 +183,22 @@ class TestQtUtilities(unittest.TestCase):
 
         self.assertEqual(font, expected_font)
 
-    def test_get_qt_color_valid_hex_color(self):
-        # Test with a valid hex color
-        expected = ui_qt.QtGui.QColor("#FF0000")
-        result = qt_utils.get_qt_color("#FF0000")
-        self.assertEqual(expected, result)
-
-    def test_get_qt_color_valid_color_name(self):
-        # Test with a valid color name
-        expected = ui_qt.QtGui.QColor("red")
-        result = qt_utils.get_qt_color("red")
-        self.assertEqual(expected, result)
-
-    def test_get_qt_color_invalid_color_input(self):
-        # Test with an invalid color input
-        expected = None
-        result = qt_utils.get_qt_color("invalid_color")
-        self.assertEqual(expected, result)
-
-    def test_get_qt_color_color_object_input(self):
-        # Test with a QColor object as input
-        input_color = ui_qt.QtGui.QColor("#00FF00")
-        expected = input_color
-        result = qt_utils.get_qt_color(input_color)
-        self.assertEqual(expected, result)
-
-    def test_get_qt_color_none_input(self):
-        # Test with None as input
-        expected = None
-        result = qt_utils.get_qt_color(None)
-        self.assertEqual(expected, result)
-
-    def test_get_qt_color_library(self):
-        # Test with None as input
+    def test_get_qt_color(self):
         import gt.ui.resource_library as ui_res_lib
 
-        expected = ui_qt.QtGui.QColor(ui_res_lib.Color.RGB.red)
-        result = qt_utils.get_qt_color(ui_res_lib.Color.RGB.red)
-        self.assertEqual(expected, result)
+        input_color = ui_qt.QtGui.QColor("#00FF00")
+        cases = [
+            ("#FF0000", ui_qt.QtGui.QColor("#FF0000")),  # Valid hex color
+            ("red", ui_qt.QtGui.QColor("red")),  # Valid color name
+            ("invalid_color", None),  # Invalid color input
+            (input_color, input_color),  # QColor object as input
+            (None, None),  # None as input
+            (ui_res_lib.Color.RGB.red, ui_qt.QtGui.QColor(ui_res_lib.Color.RGB.red)),  # Resource library color
+        ]
+        for input_value, expected in cases:
+            with self.subTest(input_value=input_value):
+                result = qt_utils.get_qt_color(input_value)
+                self.assertEqual(expected, result)
 
     @patch("gt.ui.qt_import.QtWidgets.QDesktopWidget")
     def test_resize_to_screen_valid_percentage(self, mock_desktop_widget):
@@ -269,10 +253,6 @@ class TestQtUtilities(unittest.TestCase):
 
     def test_update_formatted_label_custom_format(self):
         mock_label = ui_qt.QtWidgets.QLabel()
-        expected_html = (
-            "<html><div style='text-align:left;'><b><font size='16' color='blue' style='background-color:"
-            "yellow;'>Text</font></b><b><font size='14' color='red'>Output</font></b></div></html>"
-        )
         qt_utils.update_formatted_label(
             mock_label,
             "Text",
@@ -287,7 +267,7 @@ class TestQtUtilities(unittest.TestCase):
             overall_alignment="left",
         )
         result_html = mock_label.text()
-        self.assertEqual(expected_html, result_html)
+        self.assertEqual(EXPECTED_CUSTOM_FORMATTED_LABEL, result_html)
 
     def test_load_and_scale_pixmap_scale_by_percentage(self):
         # Test scaling by percentage
@@ -373,8 +353,8 @@ class TestQtUtilities(unittest.TestCase):
         self.assertIsNone(result)
 
     @patch("gt.ui.qt_import.QtWidgets.QApplication")
-    def test_get_screen_dpi_scale_valid_screen_number(self, mock_qapp):
-        # Create a mock QApplication instance with mock screens
+    def test_get_screen_dpi_scale(self, mock_qapp):
+        # Create a mock QApplication instance with mock screens (shared by all cases)
         app = MagicMock()
         screen1 = MagicMock()
         screen2 = MagicMock()
@@ -385,26 +365,12 @@ class TestQtUtilities(unittest.TestCase):
         # Replace the QApplication instance with the mock
         mock_qapp.instance.return_value = app
 
-        expected_result = 1
-        result = qt_utils.get_screen_dpi_scale(screen_number=1)
-        self.assertEqual(expected_result, result)
-        expected_result = 1.25
-        result = qt_utils.get_screen_dpi_scale(screen_number=0)
-        self.assertEqual(expected_result, result)
-
-    @patch("gt.ui.qt_import.QtWidgets.QApplication")
-    def test_get_screen_dpi_scale_negative_screen_number(self, mock_app):
-        # Create a mock QApplication instance with mock screens
-        app = MagicMock()
-        screen1 = MagicMock()
-        screen2 = MagicMock()
-        screen1.logicalDotsPerInch.return_value = 120.0
-        screen2.logicalDotsPerInch.return_value = 96.0
-        app.screens.return_value = [screen1, screen2]
-
-        # Replace the QApplication instance with the mock
-        mock_app.instance.return_value = app
-
-        # Test with a negative screen number (screen_number = -1)
-        with self.assertRaises(ValueError):
-            qt_utils.get_screen_dpi_scale(-1)
+        cases = [(1, 1), (0, 1.25), (-1, ValueError)]
+        for screen_number, expected in cases:
+            with self.subTest(screen_number=screen_number):
+                if expected is ValueError:
+                    with self.assertRaises(ValueError):
+                        qt_utils.get_screen_dpi_scale(screen_number)
+                else:
+                    result = qt_utils.get_screen_dpi_scale(screen_number=screen_number)
+                    self.assertEqual(expected, result)
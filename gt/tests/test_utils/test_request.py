@@ -47,6 +47,33 @@ class TestRequestUtils(unittest.TestCase):
         expected = "mocked_decode"
         self.assertEqual(expected, response_content)
 
+    @patch("http.client.HTTPSConnection")
+    def test_http_get_request_headers(self, mock_http_connection):
+        mock_connection = MagicMock()
+        mock_http_connection.return_value = mock_connection
+        url = "https://api.github.com/mocked_path"
+        utils_request.http_get_request(url=url, headers={"If-None-Match": "mocked_etag"})
+        request_headers = mock_connection.request.call_args[1].get("headers")
+        expected = "mocked_etag"
+        self.assertEqual(expected, request_headers.get("If-None-Match"))
+        self.assertIn("User-Agent", request_headers)
+
+    @patch("http.client.HTTPSConnection")
+    def test_http_get_request_keep_alive(self, mock_http_connection):
+        mock_connection = MagicMock()
+        mock_connection.getresponse.return_value.will_close = False
+        mock_http_connection.return_value = mock_connection
+        utils_request._KEEP_ALIVE_CONNECTIONS.clear()
+        url = "https://api.github.com/mocked_path"
+        try:
+            utils_request.http_get_request(url=url, keep_alive=True)
+            utils_request.http_get_request(url=url, keep_alive=True)
+        finally:
+            utils_request._KEEP_ALIVE_CONNECTIONS.clear()
+        mock_http_connection.assert_called_once()
+        self.assertEqual(2, mock_connection.request.call_count)
+        mock_connection.close.assert_not_called()
+
     @patch("urllib.request.urlopen")
     def test_read_url_content(self, mock_urlopen):
         mock_response = MagicMock()
@@ -21,7 +21,6 @@ import gt.tools.auto_rigger.rig_constants as tools_rig_const
 import gt.ui.resource_library as ui_res_lib
 import maya.cmds as cmds
 import logging
-import re
 
 # Logging Setup
 logging.basicConfig()
@@ -86,20 +85,26 @@ class ModuleSpine(tools_rig_frm.ModuleGeneric):
         self.spine_proxies = []
         self.set_spine_num(spine_num=2)
 
-    def set_spine_num(self, spine_num):
+    def set_spine_num(self, spine_num, refresh_proxies=True, proxy_uuids=None):
         """
         Set a new number of spine proxies. These are the proxies in-between the hip proxy (base) and chest proxy (end)
         Args:
             spine_num (int): New number of spines to exist in-between hip and chest.
                              Minimum is zero (0) - No negative numbers.
+            refresh_proxies (bool, optional): If True, the main proxies list is refreshed after the update.
+                                              Callers that refresh it themselves right after can skip it.
+            proxy_uuids (dict, optional): Purpose to UUID of the new spine proxies. e.g. {"spine01": "1234..."}
+                                          When provided, new spines are created with these UUIDs instead of
+                                          generating new ones (used when reading them from a dictionary).
         """
+        proxy_uuids = proxy_uuids or {}
         spines_len = len(self.spine_proxies)
         # Same as current, skip
         if spines_len == spine_num:
             return
 
         # set the right chest name
-        chest_name = f"spine{str(spine_num + 1).zfill(2)}"
+        chest_name = f"spine{spine_num + 1:02d}"
         self.chest_proxy.set_name(name=chest_name)
         self.chest_proxy.set_meta_purpose(value=chest_name)
 
@@ -112,8 +117,8 @@ class ModuleSpine(tools_rig_frm.ModuleGeneric):
                 _parent_uuid = self.hip_proxy.get_uuid()
             # Create new spines
             for num in range(spines_len, spine_num):
-                new_spine_name = f"{self.setup_name + str(num + 1).zfill(2)}"
-                new_spine = tools_rig_frm.Proxy(name=new_spine_name)
+                new_spine_name = f"{self.setup_name}{num + 1:02d}"
+                new_spine = tools_rig_frm.Proxy(name=new_spine_name, uuid=proxy_uuids.get(new_spine_name))
                 new_spine.set_locator_scale(scale=1)
                 new_spine.add_color(rgb_color=core_color.ColorConstants.RigProxy.FOLLOWER)
                 new_spine.set_meta_purpose(value=new_spine_name)
@@ -134,7 +139,8 @@ class ModuleSpine(tools_rig_frm.ModuleGeneric):
         else:
             self.chest_proxy.add_line_parent(line_parent=self.hip_proxy.get_uuid())
 
-        self.refresh_proxies_list()
+        if refresh_proxies:
+            self.refresh_proxies_list()
 
     def refresh_proxies_list(self):
         """
@@ -166,21 +172,24 @@ class ModuleSpine(tools_rig_frm.ModuleGeneric):
             return
         # Determine Number of Spine Proxies
         _spine_num = 0
-        spine_pattern = r"spine\d+"
+        _purpose_uuids = {}
         for uuid, description in proxy_dict.items():
             metadata = description.get("metadata")
             if metadata:
                 meta_type = metadata.get(tools_rig_const.RiggerConstants.META_PROXY_PURPOSE)
-                if bool(re.match(spine_pattern, meta_type)):
+                if not meta_type:
+                    continue
+                if meta_type.startswith("spine") and meta_type[5:6].isdigit():  # Same as matching "spine\d+"
                     _spine_num += 1
+                    _purpose_uuids[meta_type] = uuid
 
         # the chest (last joint of the spine) is called with the same pattern (spine + num)
         # spine num indicates the number of middle joints
         _spine_num = _spine_num - 1
-        self.set_spine_num(_spine_num)
+        self.set_spine_num(_spine_num, refresh_proxies=False, proxy_uuids=_purpose_uuids)
+        self.refresh_proxies_list()  # Once, reading the proxies data doesn't change the list
 
         self.read_purpose_matching_proxy_from_dict(proxy_dict)
-        self.refresh_proxies_list()
 
     # --------------------------------------------------- Misc ---------------------------------------------------
     def is_valid(self):
@@ -210,53 +219,54 @@ class ModuleSpine(tools_rig_frm.ModuleGeneric):
         Runs post proxy script.
         When in a project, this runs after the "build_proxy" is done in all modules.
         """
-        # Get Maya Elements
-        hip = tools_rig_utils.find_proxy_from_uuid(self.hip_proxy.get_uuid())
-        chest = tools_rig_utils.find_proxy_from_uuid(self.chest_proxy.get_uuid())
-
-        # Add COG initial ROT order
-        cog_rot_order_attr = (
-            core_attr.add_attr(
-                obj_list=hip,
-                attributes=self._attr_rot_order_cog,
-                attr_type="enum",
-                enum="xyz:yzx:zxy:xzy:yxz:zyx",
-                default=0,
+        function_name = "Spine - Build Proxy Setup"
+        cmds.undoInfo(openChunk=True, chunkName=function_name)  # Offsets, constraints and transforms as one step
+        try:
+            # Get Maya Elements (Single scene query for all proxies)
+            spine_uuids = [spine.get_uuid() for spine in self.spine_proxies]
+            proxy_nodes = tools_rig_utils.get_proxies_by_uuid()
+            hip = proxy_nodes.get(self.hip_proxy.get_uuid())
+            chest = proxy_nodes.get(self.chest_proxy.get_uuid())
+
+            # Add COG initial ROT order
+            cog_rot_order_attr = (
+                core_attr.add_attr(
+                    obj_list=hip,
+                    attributes=self._attr_rot_order_cog,
+                    attr_type="enum",
+                    enum="xyz:yzx:zxy:xzy:yxz:zyx",
+                    default=0,
+                )
+                or []
             )
-            or []
-        )
-        cmds.setAttr(cog_rot_order_attr[0], 2)  # zxy
-
-        # Add IK initial ROT order
-        ik_rot_order_attr = (
-            core_attr.add_attr(
-                obj_list=chest,
-                attributes=tools_rig_const.RiggerConstants.ATTR_ROT_ORDER_IK,
-                attr_type="enum",
-                enum="xyz:yzx:zxy:xzy:yxz:zyx",
-                default=0,
+            cmds.setAttr(cog_rot_order_attr[0], 2)  # zxy
+
+            # Add IK initial ROT order
+            ik_rot_order_attr = (
+                core_attr.add_attr(
+                    obj_list=chest,
+                    attributes=tools_rig_const.RiggerConstants.ATTR_ROT_ORDER_IK,
+                    attr_type="enum",
+                    enum="xyz:yzx:zxy:xzy:yxz:zyx",
+                    default=0,
+                )
+                or []
             )
-            or []
-        )
-        cmds.setAttr(ik_rot_order_attr[0], 2)  # zxy
-
-        spines = []
-        for spine in self.spine_proxies:
-            spine_node = tools_rig_utils.find_proxy_from_uuid(spine.get_uuid())
-            spines.append(spine_node)
-        self.hip_proxy.apply_offset_transform()
-        self.chest_proxy.apply_offset_transform()
-
-        spine_offsets = []
-        for spine in spines:
-            offset = tools_rig_utils.get_proxy_offset(spine)
-            spine_offsets.append(offset)
-        core_cnstr.equidistant_constraints(start=hip, end=chest, target_list=spine_offsets)
-
-        self.hip_proxy.apply_transforms()
-        self.chest_proxy.apply_transforms()
-        for spine in self.spine_proxies:
-            spine.apply_transforms()
+            cmds.setAttr(ik_rot_order_attr[0], 2)  # zxy
+
+            spines = [str(proxy_nodes.get(uuid)) for uuid in spine_uuids if proxy_nodes.get(uuid)]
+            self.hip_proxy.apply_offset_transform()
+            self.chest_proxy.apply_offset_transform()
+
+            spine_offsets = tools_rig_utils.get_proxy_offsets(spines)
+            core_cnstr.equidistant_constraints(start=hip, end=chest, target_list=spine_offsets)
+
+            self.hip_proxy.apply_transforms()
+            self.chest_proxy.apply_transforms()
+            for spine in self.spine_proxies:
+                spine.apply_transforms()
+        finally:
+            cmds.undoInfo(closeChunk=True, chunkName=function_name)
         cmds.select(clear=True)
 
     def build_skeleton_joints(self):
@@ -276,11 +286,13 @@ class ModuleSpine(tools_rig_frm.ModuleGeneric):
 
         # get Joints
         global_o_ctrl = tools_rig_utils.find_ctrl_global_offset()
-        hip_jnt = tools_rig_utils.find_joint_from_uuid(self.hip_proxy.get_uuid())
-        chest_jnt = tools_rig_utils.find_joint_from_uuid(self.chest_proxy.get_uuid())
-        middle_jnt_list = [tools_rig_utils.find_joint_from_uuid(prx.get_uuid()) for prx in self.spine_proxies]
+        parent_module_uuid = self.get_parent_uuid()
+        joints_by_uuid = tools_rig_utils.get_joints_by_uuid()
+        hip_jnt = joints_by_uuid.get(self.hip_proxy.get_uuid())
+        chest_jnt = joints_by_uuid.get(self.chest_proxy.get_uuid())
+        middle_jnt_list = [joints_by_uuid.get(prx.get_uuid()) for prx in self.spine_proxies]
         spine_jnt_list = [hip_jnt] + middle_jnt_list + [chest_jnt]
-        module_parent_driven_jnt = tools_rig_utils.get_driven_joint(self.get_parent_uuid())
+        module_parent_driven_jnt = tools_rig_utils.get_driven_joint(parent_module_uuid)
 
         # setup names
         setup_name = self.setup_name
@@ -296,8 +308,9 @@ class ModuleSpine(tools_rig_frm.ModuleGeneric):
         # set joints colors
         core_color.set_color_viewport(obj_list=spine_jnt_list, rgb_color=core_color.ColorConstants.RigJoint.GENERAL)
 
-        # get spine scale
-        spine_scale = core_math.dist_center_to_center(hip_jnt, chest_jnt)
+        # get spine positions and scale (Queried once, base joints are only driven with offset constraints)
+        spine_jnt_positions = [cmds.xform(jnt, query=True, translation=True, worldSpace=True) for jnt in spine_jnt_list]
+        spine_scale = core_math.dist_xyz_to_xyz(*spine_jnt_positions[0], *spine_jnt_positions[-1])
 
         # set hip parent
         hip_parent = set_hip_parent(joint_automation_group, module_parent_driven_jnt)
@@ -355,8 +368,7 @@ class ModuleSpine(tools_rig_frm.ModuleGeneric):
         # -- attributes
         core_attr.hide_lock_default_attrs(obj_list=cog_ctrl, scale=True, visibility=True)
         # -- follow setup - Rotation and Position
-        parent_module_uuid = self.get_parent_uuid()
-        _cog_follow_parent = tools_rig_utils.find_joint_from_uuid(parent_module_uuid)
+        _cog_follow_parent = joints_by_uuid.get(parent_module_uuid)
         # define COG parent (potential overwrite)
         if isinstance(self.cog_parent, str):
             if cmds.objExists(self.cog_parent):
@@ -578,10 +590,9 @@ class ModuleSpine(tools_rig_frm.ModuleGeneric):
 
         # Create Follicles
         follicle_transforms = []
-        for index, joint in enumerate(spine_jnt_list):
+        for index, joint_pos in enumerate(spine_jnt_positions):
             if index == 0 or index == len(spine_jnt_list) - 1:  # Skip Hip and Chest
                 continue
-            joint_pos = cmds.xform(joint, query=True, translation=True, worldSpace=True)
             u_pos, v_pos = core_surface.get_closest_uv_point(surface=ribbon_sur, xyz_pos=joint_pos)
             v_pos_normalized = v_pos / (len(spine_jnt_list) - 1)
             fol_trans, fol_shape = core_surface.create_follicle(
@@ -948,17 +959,12 @@ def build_knt_skeleton(skeleton_suffix, hip_parent, hip_jnt, middle_jnt_list, ch
         logger.error("given kinematic not defined")
         return
 
-    hip_knt_joint = core_rigging.duplicate_joint_for_automation(hip_jnt, suffix=suffix, parent=hip_parent)
-
-    mid_knt_joints = []
-    last_mid_parent = hip_knt_joint
-    for mid in middle_jnt_list:
-        mid_knt_joint = core_rigging.duplicate_joint_for_automation(mid, suffix=suffix, parent=last_mid_parent)
-        mid_knt_joints.append(mid_knt_joint)
-        last_mid_parent = mid_knt_joint
-
-    chest_knt_joint = core_rigging.duplicate_joint_for_automation(chest_jnt, suffix=suffix, parent=last_mid_parent)
-    knt_joints = [hip_knt_joint] + mid_knt_joints + [chest_knt_joint]
+    knt_joints = core_rigging.duplicate_joint_chain_for_automation(
+        [hip_jnt] + list(middle_jnt_list) + [chest_jnt], suffix=suffix, parent=hip_parent
+    )
+    hip_knt_joint = knt_joints[0]
+    mid_knt_joints = knt_joints[1:-1]
+    chest_knt_joint = knt_joints[-1]
 
     core_rigging.rescale_joint_radius(joint_list=knt_joints, multiplier=radius_multiplier)
     core_color.set_color_viewport(obj_list=knt_joints, rgb_color=color_viewport)
@@ -37,7 +37,10 @@ import gt.core.str as core_str
 import gt.core.io as core_io
 import maya.cmds as cmds
 import dataclasses
+import functools
 import logging
+import copy
+import sys
 import re
 import os
 from dataclasses import dataclass
@@ -55,6 +58,8 @@ class ProxyData:
     A proxy data class used as the proxy response for when the proxy is built.
     """
 
+    __slots__ = ("name", "offset", "setup", "uuid")  # No instance "__dict__" (dataclass "slots" requires 3.10+)
+
     name: str  # Long name of the generated proxy (full Maya path)
     offset: str  # Name of the proxy offset (parent of the proxy)
     setup: tuple  # Name of the proxy setup items (rig setup items)
@@ -117,6 +122,8 @@ class OrientationData:
     OrientationData object.
     """
 
+    __slots__ = ("method", "aim_axis", "up_axis", "up_dir", "world_aligned")  # Created per module (no "__dict__")
+
     class Methods:
         """
         List of recognized/accepted methods to apply
@@ -552,25 +559,172 @@ class RigPreferencesData:
 
 
 # ------------------------------------------------- Framework -------------------------------------------------
+class _SuspendedViewport:
+    """
+    Context manager used to suspend viewport updates while building many proxies or rig elements.
+    Model panels are set to isolate an empty selection (nothing is drawn) and refresh is suspended.
+    Previous isolate states and the user selection are restored on exit.
+
+    Usage:
+        with _SuspendedViewport():
+            for proxy in proxies:
+                proxy.build()
+    """
+
+    def __init__(self):
+        self.isolated_panels = []
+        self.selection = []
+
+    def __enter__(self):
+        self.selection = cmds.ls(selection=True, long=True) or []
+        cmds.select(clear=True)  # Isolate an empty set
+        for panel in cmds.getPanel(type="modelPanel") or []:
+            try:
+                if not cmds.isolateSelect(panel, query=True, state=True):
+                    cmds.isolateSelect(panel, state=True)
+                    self.isolated_panels.append(panel)
+            except Exception as e:
+                logger.debug(f'Unable to isolate panel "{panel}". Issue: {str(e)}')
+        cmds.refresh(suspend=True)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        cmds.refresh(suspend=False)
+        for panel in self.isolated_panels:
+            try:
+                cmds.isolateSelect(panel, state=False)
+            except Exception as e:
+                logger.debug(f'Unable to restore panel "{panel}". Issue: {str(e)}')
+        self.isolated_panels = []
+        selection = [obj for obj in self.selection if cmds.objExists(obj)]  # Ignores deleted/renamed objects
+        if selection:
+            cmds.select(selection, replace=True)
+        else:
+            cmds.select(clear=True)
+        self.selection = []
+
+
+class _SuspendedEvaluation:
+    """
+    Context manager used while building many nodes (proxies, joints, controls).
+    Switches the evaluation manager to DG mode ("off"), so the evaluation graph is not rebuilt after every new node,
+    and groups all operations in a single undo chunk. The previous evaluation mode is restored on exit.
+
+    Usage:
+        with _SuspendedEvaluation(chunk_name="build_rig"):
+            project.build_skeleton()
+    """
+
+    def __init__(self, chunk_name="rigger_build"):
+        self.chunk_name = chunk_name
+        self.evaluation_mode = None
+
+    def __enter__(self):
+        cmds.undoInfo(openChunk=True, chunkName=self.chunk_name)
+        try:
+            self.evaluation_mode = (cmds.evaluationManager(query=True, mode=True) or [None])[0]
+            if self.evaluation_mode and self.evaluation_mode != "off":
+                cmds.evaluationManager(mode="off")
+        except Exception as e:
+            self.evaluation_mode = None
+            logger.debug(f"Unable to change evaluation mode. Issue: {str(e)}")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if self.evaluation_mode and self.evaluation_mode != "off":
+                cmds.evaluationManager(mode=self.evaluation_mode)
+        except Exception as e:
+            logger.debug(f'Unable to restore evaluation mode "{self.evaluation_mode}". Issue: {str(e)}')
+        cmds.undoInfo(closeChunk=True, chunkName=self.chunk_name)
+
+
+def _typed(expected_type, message):
+    """
+    Decorator for single argument setters. Skips the setter and logs a warning when the received value is not of the
+    expected type. (Accepts the value as a positional or keyword argument)
+    Args:
+        expected_type (type, tuple): Type (or tuple of types) the received value must be an instance of.
+        message (str): Warning logged when the validation fails. It receives the invalid type through a "%s".
+    Returns:
+        callable: The decorator.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            value = args[0] if args else next(iter(kwargs.values()), None)
+            if not isinstance(value, expected_type):
+                logger.warning(message, type(value))
+                return
+            return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def finalize_proxy_builds(proxy_nodes=None):
+    """
+    Redraws the viewport once after building a batch of proxies. (Proxy "build" never refreshes on its own)
+    Args:
+        proxy_nodes (list, str, optional): If provided, these nodes are marked as dirty before the refresh, so their
+                                           shapes (e.g. locator scale clusters) are re-evaluated. e.g. ["|proxy"]
+    """
+    if isinstance(proxy_nodes, str):
+        proxy_nodes = [proxy_nodes]
+    proxy_nodes = [str(node) for node in proxy_nodes or [] if node and cmds.objExists(str(node))]
+    if proxy_nodes:
+        cmds.dgdirty(proxy_nodes)
+    cmds.refresh(force=True)
+
+
 class Proxy:
+    __slots__ = (
+        "name",
+        "transform",
+        "offset_transform",
+        "curve",
+        "uuid",
+        "parent_uuid",
+        "attr_dict",
+        "metadata",
+        "_dict_cache",
+    )
+    _DEFAULT_CURVE_PROTOTYPE = None  # Parsed "_proxy_joint" curve, loaded once and copied by each new proxy
+    _DICT_SETTERS = (  # Proxy dictionary key and the setter used to read it. (Transforms are read separately)
+        ("name", "set_name"),
+        ("parent", "set_parent_uuid"),
+        ("attributes", "set_attr_dict"),
+        ("metadata", "set_metadata_dict"),
+        ("uuid", "set_uuid"),
+    )
+
     def __init__(self, name=None, uuid=None):
 
         # Default Values
+        self._dict_cache = None  # "get_proxy_as_dict" outputs, cleared (None) by any method that modifies the proxy
         self.name = "proxy"
+        if name and isinstance(name, str):
+            self.name = name
+        elif name:
+            logger.warning('Unable to set new name. Expected string but got "%s"', type(name))
         self.transform = None
         self.offset_transform = None
-        self.curve = core_curve.get_curve("_proxy_joint")
-        self.curve.set_name(name=self.name)
-        self.uuid = core_uuid.generate_uuid(remove_dashes=True)
+        if Proxy._DEFAULT_CURVE_PROTOTYPE is None:
+            Proxy._DEFAULT_CURVE_PROTOTYPE = core_curve.get_curve("_proxy_joint")
+        self.curve = copy.copy(Proxy._DEFAULT_CURVE_PROTOTYPE)  # Shallow, shapes are shared but never modified
+        self.curve.set_name(name=self.name)  # Final name is known, so the curve is only named once
+        self.uuid = None
         self.parent_uuid = None
-        self.attr_dict = {}
+        self.attr_dict = None  # Initialized when the first attribute is added
         self.set_locator_scale(scale=1)  # 100% - Initial curve scale
         self.metadata = None
 
-        if name:
-            self.set_name(name)
         if uuid:
             self.set_uuid(uuid)
+        if not self.uuid:  # Only generated when not provided (or invalid)
+            self.uuid = core_uuid.generate_uuid(remove_dashes=True)
 
     def is_valid(self):
         """
@@ -587,6 +741,8 @@ class Proxy:
     def build(self, prefix=None, suffix=None, apply_transforms=False, optimized=False):
         """
         Builds a proxy object.
+        When building multiple proxies, prefer the module or project "build_proxy" functions, as they suspend
+        viewport updates during the build (avoiding one redraw per proxy).
         Args:
             prefix (str, optional): If provided, this prefix will be added to the proxy when it's created.
             suffix (str, optional): If provided, this suffix will be added to the proxy when it's created.
@@ -619,16 +775,18 @@ class Proxy:
             core_ctrl.add_snapping_shape(proxy_crv)
         if prefix:
             self.curve.set_name(self.name)  # Restore name without prefix
+        # Long names are derived instead of queried: offset lives under world and the curve is its direct child
+        if not proxy_offset.startswith("|"):
+            proxy_offset = f"|{proxy_offset}"
         proxy_crv = cmds.parent(proxy_crv, proxy_offset)[0]
-        proxy_offset = core_naming.get_long_name(proxy_offset)
-        proxy_crv = core_naming.get_long_name(proxy_crv)
+        proxy_crv = f"{proxy_offset}|{proxy_crv.split('|')[-1]}"
 
         core_attr.add_separator_attr(
             target_object=proxy_crv,
             attr_name=f"proxy{core_str.upper_first_char(core_rigging.RiggingConstants.SEPARATOR_CONTROL)}",
         )
-        uuid_attrs = core_uuid.add_uuid_attr(
-            obj_list=proxy_crv, attr_name=tools_rig_const.RiggerConstants.ATTR_PROXY_UUID, set_initial_uuid_value=False
+        core_uuid.add_uuid_attr(
+            obj_list=proxy_crv, attr_name=tools_rig_const.RiggerConstants.ATTR_PROXY_UUID, uuid_value=self.uuid
         )
         rot_order_attr = (
             core_attr.add_attr(
@@ -647,33 +805,28 @@ class Proxy:
             or []
         )
         loc_scale_cluster = None
-        if not optimized and scale_attr and len(scale_attr) == 1:
-            scale_attr = scale_attr[0]
-            loc_scale_cluster = core_curve.add_shape_scale_cluster(proxy_crv, scale_driver_attr=scale_attr)
-        for attr in uuid_attrs:
-            core_attr.set_attr(attribute_path=attr, value=self.uuid)
+        if not optimized and len(scale_attr) == 1:
+            loc_scale_cluster = core_curve.add_shape_scale_cluster(proxy_crv, scale_driver_attr=scale_attr[0])
         # Set Transforms
         if self.offset_transform and apply_transforms:
             self.offset_transform.apply_transform(target_object=proxy_offset, world_space=True)
         if self.transform and apply_transforms:
             self.transform.apply_transform(target_object=proxy_crv, world_space=True)
         # Set Rotation Order
-        if self.get_attr_dict_value(tools_rig_const.RiggerConstants.ATTR_ROT_ORDER) is not None:
-            _rot_order = self.get_rotation_order()
-            core_attr.set_attr(rot_order_attr, _rot_order)
+        if rot_order_attr and self.get_attr_dict_value(tools_rig_const.RiggerConstants.ATTR_ROT_ORDER) is not None:
+            cmds.setAttr(rot_order_attr[0], self.get_rotation_order())
         # Set Locator Scale
-        if self.get_attr_dict_value(tools_rig_const.RiggerConstants.ATTR_PROXY_SCALE) is not None:
-            _locator_scale = self.get_locator_scale()
-            core_attr.set_attr(scale_attr, _locator_scale)
+        if scale_attr and self.get_attr_dict_value(tools_rig_const.RiggerConstants.ATTR_PROXY_SCALE) is not None:
+            cmds.setAttr(scale_attr[0], self.get_locator_scale())
 
-        return ProxyData(name=proxy_crv, offset=proxy_offset, setup=(loc_scale_cluster,), uuid=self.get_uuid())
+        return ProxyData(name=proxy_crv, offset=proxy_offset, setup=(loc_scale_cluster,), uuid=self.uuid)
 
     def apply_offset_transform(self):
         """
         Attempts to apply transform values to the offset of the proxy.
         To be used only after proxy is built.
         """
-        proxy_crv = tools_rig_utils.find_proxy_from_uuid(uuid_string=self.uuid)
+        proxy_crv = tools_rig_utils.find_proxy_from_uuid(self.uuid)
         if proxy_crv:
             proxy_offset = tools_rig_utils.get_proxy_offset(proxy_crv)
             if proxy_offset and self.offset_transform:
@@ -686,7 +839,7 @@ class Proxy:
         Args:
             apply_offset (bool, optional): If True, it will attempt to also apply the offset data. (Happens first)
         """
-        proxy_crv = tools_rig_utils.find_proxy_from_uuid(uuid_string=self.uuid)
+        proxy_crv = tools_rig_utils.find_proxy_from_uuid(self.uuid)
         if proxy_crv and apply_offset:
             proxy_offset = tools_rig_utils.get_proxy_offset(proxy_crv)
             if proxy_offset and self.offset_transform:
@@ -701,20 +854,34 @@ class Proxy:
             target_obj (str, optional): Affected object, this is the object to get its attributes updated.
                                         If not provided it will attempt to retrieve the proxy using its UUID
         """
+        if not target_obj:  # Found proxies exist, only caller provided objects are checked
+            target_obj = tools_rig_utils.find_proxy_from_uuid(self.uuid)
+        elif not cmds.objExists(target_obj):
+            target_obj = None
         if not target_obj:
-            target_obj = tools_rig_utils.find_proxy_from_uuid(self.get_uuid())
-        if not target_obj or not cmds.objExists(target_obj):
             logger.debug(f"Unable to apply proxy attributes. Failed to find target object.")
             return
-        if self.attr_dict:
-            for attr, value in self.attr_dict.items():
-                core_attr.set_attr(obj_list=str(target_obj), attr_list=str(attr), value=value)
+        if not self.attr_dict:
+            return
+        target_obj = str(target_obj)
+        for attr, value in self.attr_dict.items():  # Direct "setAttr" calls, same type handling as "set_attr"
+            attr_path = f"{target_obj}.{attr}"
+            try:
+                if isinstance(value, str):
+                    cmds.setAttr(attr_path, value, typ="string")
+                elif isinstance(value, (tuple, list)):
+                    cmds.setAttr(attr_path, *value, typ="double3")
+                else:
+                    cmds.setAttr(attr_path, value)
+            except Exception as e:
+                logger.debug(f'Unable to set attribute "{attr_path}". Issue: "{e}".')
 
     def _initialize_transform(self):
         """
         In case a transform is necessary and none is present,
         a default Transform object is created and stored in "self.transform".
         """
+        self._dict_cache = None
         if not self.transform:
             self.transform = core_trans.Transform()  # Default is T:(0,0,0) R:(0,0,0) and S:(1,1,1)
 
@@ -723,6 +890,7 @@ class Proxy:
         In case an offset transform is necessary and none is present,
         a default Transform object is created and stored in "self.offset_transform".
         """
+        self._dict_cache = None
         if not self.offset_transform:
             self.offset_transform = core_trans.Transform()  # Default is T:(0,0,0) R:(0,0,0) and S:(1,1,1)
 
@@ -733,23 +901,21 @@ class Proxy:
         Args:
             name (str): New name to use on the proxy.
         """
+        self._dict_cache = None
         if name is None or not isinstance(name, str):
-            logger.warning(f'Unable to set new name. Expected string but got "{str(type(name))}"')
+            logger.warning('Unable to set new name. Expected string but got "%s"', type(name))
             return
         self.curve.set_name(name)
         self.name = name
 
+    @_typed(core_trans.Transform, 'Unable to set proxy transform. Must be a "Transform" object, but got "%s".')
     def set_transform(self, transform):
         """
         Sets the transform for this proxy element
         Args:
             transform (Transform): A transform object describing position, rotation and scale.
         """
-        if not transform or not isinstance(transform, core_trans.Transform):
-            logger.warning(
-                f"Unable to set proxy transform. " f'Must be a "Transform" object, but got "{str(type(transform))}".'
-            )
-            return
+        self._dict_cache = None
         self.transform = transform
 
     def set_initial_position(self, x=None, y=None, z=None, xyz=None):
@@ -784,6 +950,7 @@ class Proxy:
             z (float, int, optional): Z value for the position. If provided, you must provide X and Y too.
             xyz (Vector3, list, tuple) A Vector3 with the new position or a tuple/list with X, Y and Z values.
         """
+        self._dict_cache = None
         self._initialize_transform()
         self.transform.set_position(x=x, y=y, z=z, xyz=xyz)
 
@@ -796,6 +963,7 @@ class Proxy:
             z (float, int, optional): Z value for the rotation. If provided, you must provide X and Y too.
             xyz (Vector3, list, tuple) A Vector3 with the new position or a tuple/list with X, Y and Z values.
         """
+        self._dict_cache = None
         self._initialize_transform()
         self.transform.set_rotation(x=x, y=y, z=z, xyz=xyz)
 
@@ -808,20 +976,18 @@ class Proxy:
             z (float, int, optional): Z value for the scale. If provided, you must provide X and Y too.
             xyz (Vector3, list, tuple) A Vector3 with the new position or a tuple/list with X, Y and Z values.
         """
+        self._dict_cache = None
         self._initialize_transform()
         self.transform.set_scale(x=x, y=y, z=z, xyz=xyz)
 
+    @_typed(core_trans.Transform, 'Unable to set proxy transform. Must be a "Transform" object, but got "%s".')
     def set_offset_transform(self, transform):
         """
         Sets the transform for this proxy element
         Args:
             transform (Transform): A transform object describing position, rotation and scale.
         """
-        if not transform or not isinstance(transform, core_trans.Transform):
-            logger.warning(
-                f"Unable to set proxy transform. " f'Must be a "Transform" object, but got "{str(type(transform))}".'
-            )
-            return
+        self._dict_cache = None
         self.offset_transform = transform
 
     def set_offset_position(self, x=None, y=None, z=None, xyz=None):
@@ -833,6 +999,7 @@ class Proxy:
             z (float, int, optional): Z value for the position. If provided, you must provide X and Y too.
             xyz (Vector3, list, tuple) A Vector3 with the new position or a tuple/list with X, Y and Z values.
         """
+        self._dict_cache = None
         self._initialize_offset_transform()
         self.offset_transform.set_position(x=x, y=y, z=z, xyz=xyz)
 
@@ -845,6 +1012,7 @@ class Proxy:
             z (float, int, optional): Z value for the rotation. If provided, you must provide X and Y too.
             xyz (Vector3, list, tuple) A Vector3 with the new position or a tuple/list with X, Y and Z values.
         """
+        self._dict_cache = None
         self._initialize_offset_transform()
         self.offset_transform.set_rotation(x=x, y=y, z=z, xyz=xyz)
 
@@ -857,6 +1025,7 @@ class Proxy:
             z (float, int, optional): Z value for the scale. If provided, you must provide X and Y too.
             xyz (Vector3, list, tuple) A Vector3 with the new position or a tuple/list with X, Y and Z values.
         """
+        self._dict_cache = None
         self._initialize_offset_transform()
         self.offset_transform.set_scale(x=x, y=y, z=z, xyz=xyz)
 
@@ -918,6 +1087,7 @@ class Proxy:
 
         self.add_to_attr_dict(attr=tools_rig_const.RiggerConstants.ATTR_ROT_ORDER, value=_rot_order)
 
+    @_typed(dict, 'Unable to set attribute dictionary. Expected a dictionary, but got: "%s"')
     def set_attr_dict(self, attr_dict):
         """
         Sets the attributes dictionary for this proxy. Attributes are any key/value pairs further describing the proxy.
@@ -925,11 +1095,7 @@ class Proxy:
             attr_dict (dict): An attribute dictionary where the key is the attribute and value is the attribute value.
                               e.g. {"locatorScale": 1, "isVisible": True}
         """
-        if not isinstance(attr_dict, dict):
-            logger.warning(
-                f"Unable to set attribute dictionary. " f'Expected a dictionary, but got: "{str(type(attr_dict))}"'
-            )
-            return
+        self._dict_cache = None
         self.attr_dict = attr_dict
 
     def add_to_attr_dict(self, attr, value):
@@ -940,17 +1106,19 @@ class Proxy:
             attr (str): Attribute name (also used as key on the dictionary)
             value (Any): Value for the attribute
         """
+        self._dict_cache = None
+        if self.attr_dict is None:  # Initialize attribute dictionary in case it was never used.
+            self.attr_dict = {}
         self.attr_dict[attr] = value
 
+    @_typed(dict, 'Unable to set proxy metadata. Expected a dictionary, but got: "%s"')
     def set_metadata_dict(self, metadata):
         """
         Sets the metadata property. The metadata is any extra value used to further describe the curve.
         Args:
             metadata (dict): A dictionary describing extra information about the curve
         """
-        if not isinstance(metadata, dict):
-            logger.warning(f'Unable to set proxy metadata. Expected a dictionary, but got: "{str(type(metadata))}"')
-            return
+        self._dict_cache = None
         self.metadata = metadata
 
     def add_to_metadata(self, key, value):
@@ -961,8 +1129,8 @@ class Proxy:
             key (str): Key of the new metadata element
             value (Any): Value of the new metadata element
         """
-        if not self.metadata:  # Initialize metadata in case it was never used.
-            self.metadata = {}
+        self._dict_cache = None
+        self.metadata = self.metadata or {}  # Initialize metadata in case it was never used.
         self.metadata[key] = value
 
     def add_line_parent(self, line_parent):
@@ -972,8 +1140,8 @@ class Proxy:
         Args:
             line_parent (str, Proxy): New meta parent, if a UUID string. If Proxy, it will get the UUID (get_uuid).
         """
-        if not self.metadata:  # Initialize metadata in case it was never used.
-            self.metadata = {}
+        self._dict_cache = None
+        self.metadata = self.metadata or {}  # Initialize metadata in case it was never used.
         if isinstance(line_parent, str) and core_uuid.is_uuid_valid(line_parent):
             self.metadata[tools_rig_const.RiggerConstants.META_PROXY_LINE_PARENT] = line_parent
         if isinstance(line_parent, Proxy):
@@ -988,13 +1156,13 @@ class Proxy:
             driver_type (str, list): New type/tag to add. e.g. "fk", "ik", "offset", etc...
                               Can also be a list of new tags: e.g. ["fk", "ik"]
         """
+        self._dict_cache = None
         if isinstance(driver_type, str):
             driver_type = [driver_type]
         if not isinstance(driver_type, list) or driver_type is None:
             logger.debug(f"Invalid data type was provided. Add driver operation was skipped.")
             return
-        if not self.metadata:  # Initialize metadata in case it was never used.
-            self.metadata = {}
+        self.metadata = self.metadata or {}  # Initialize metadata in case it was never used.
         if isinstance(driver_type, str):
             driver_type = [driver_type]
         new_drivers = self.metadata.get(tools_rig_const.RiggerConstants.META_PROXY_DRIVERS, [])
@@ -1008,6 +1176,7 @@ class Proxy:
         """
         Clears any driver tags found in the metadata.
         """
+        self._dict_cache = None
         if self.metadata:
             self.metadata.pop(tools_rig_const.RiggerConstants.META_PROXY_DRIVERS, None)
 
@@ -1020,8 +1189,8 @@ class Proxy:
         """
         if isinstance(rgb_color, (tuple, list)) and len(rgb_color) >= 3:  # 3 = RGB
             if all(isinstance(item, (int, float)) for item in rgb_color):
-                self.attr_dict["autoColor"] = False
-                self.attr_dict["colorDefault"] = [rgb_color[0], rgb_color[1], rgb_color[2]]
+                self.add_to_attr_dict(attr="autoColor", value=False)
+                self.add_to_attr_dict(attr="colorDefault", value=[rgb_color[0], rgb_color[1], rgb_color[2]])
             else:
                 logger.debug(f"Unable to set color. Input must contain only numeric values.")
         else:
@@ -1035,14 +1204,11 @@ class Proxy:
         Args:
             uuid (str): A new UUID for this proxy
         """
-        error_message = f"Unable to set proxy UUID. Invalid UUID input."
-        if not uuid or not isinstance(uuid, str):
-            logger.warning(error_message)
-            return
-        if core_uuid.is_uuid_valid(uuid) or core_uuid.is_short_uuid_valid(uuid):
-            self.uuid = uuid
+        self._dict_cache = None
+        if core_uuid.is_uuid_valid_any(uuid):  # Also rejects empty and non-string values
+            self.uuid = sys.intern(uuid)  # Interned, UUIDs are compared and used as keys often
         else:
-            logger.warning(error_message)
+            logger.warning("Unable to set proxy UUID. Invalid UUID input.")
 
     def set_parent_uuid(self, uuid):
         """
@@ -1051,14 +1217,11 @@ class Proxy:
         Args:
             uuid (str): A new UUID for the parent of this proxy
         """
-        error_message = f"Unable to set proxy parent UUID. Invalid UUID input."
-        if not uuid or not isinstance(uuid, str):
-            logger.warning(error_message)
-            return
-        if core_uuid.is_uuid_valid(uuid) or core_uuid.is_short_uuid_valid(uuid):
-            self.parent_uuid = uuid
+        self._dict_cache = None
+        if core_uuid.is_uuid_valid_any(uuid):  # Also rejects empty and non-string values
+            self.parent_uuid = sys.intern(uuid)
         else:
-            logger.warning(error_message)
+            logger.warning("Unable to set proxy parent UUID. Invalid UUID input.")
 
     def set_parent_uuid_from_proxy(self, parent_proxy):
         """
@@ -1079,6 +1242,7 @@ class Proxy:
         """
         Clears the parent UUID by setting the "parent_uuid" to None
         """
+        self._dict_cache = None
         self.parent_uuid = None
 
     def set_meta_purpose(self, value):
@@ -1090,6 +1254,46 @@ class Proxy:
         """
         self.add_to_metadata(key=tools_rig_const.RiggerConstants.META_PROXY_PURPOSE, value=value)
 
+    @classmethod
+    def _from_dict_fast(cls, proxy_dict, uuid=None):
+        """
+        Creates a new proxy from a proxy dictionary without going through the validation of the setters.
+        Only use it with dictionaries generated by "get_proxy_as_dict" (e.g. when reading a module/project dict),
+        for anything else, use "read_data_from_dict" instead.
+        Args:
+            proxy_dict (dict): A dictionary describing the proxy data. e.g. {"name": "proxy", "parent": "1234...", ...}
+            uuid (str, optional): UUID used when the dictionary doesn't define one. e.g. {"uuid_str": {<description>}}
+        Returns:
+            Proxy: A new proxy object populated with the dictionary data.
+        """
+        proxy = cls.__new__(cls)
+        proxy._dict_cache = None
+        proxy.name = proxy_dict.get("name") or "proxy"
+        if cls._DEFAULT_CURVE_PROTOTYPE is None:
+            cls._DEFAULT_CURVE_PROTOTYPE = core_curve.get_curve("_proxy_joint")
+        proxy.curve = copy.copy(cls._DEFAULT_CURVE_PROTOTYPE)
+        proxy.curve.name = proxy.name
+        proxy.uuid = sys.intern(proxy_dict.get("uuid") or uuid or core_uuid.generate_uuid(remove_dashes=True))
+        parent_uuid = proxy_dict.get("parent")
+        proxy.parent_uuid = sys.intern(parent_uuid) if parent_uuid else None
+        proxy.transform = None
+        proxy.offset_transform = None
+        transform = proxy_dict.get("transform")
+        if transform and len(transform) == 3:
+            proxy.transform = core_trans.Transform(
+                position=transform.get("position"), rotation=transform.get("rotation"), scale=transform.get("scale")
+            )
+        offset_transform = proxy_dict.get("offsetTransform")
+        if offset_transform and len(offset_transform) == 3:
+            proxy.offset_transform = core_trans.Transform(
+                position=offset_transform.get("position"),
+                rotation=offset_transform.get("rotation"),
+                scale=offset_transform.get("scale"),
+            )
+        proxy.attr_dict = proxy_dict.get("attributes") or {tools_rig_const.RiggerConstants.ATTR_PROXY_SCALE: 1}
+        proxy.metadata = proxy_dict.get("metadata") or None
+        return proxy
+
     def read_data_from_dict(self, proxy_dict):
         """
         Reads the data from a proxy dictionary and updates the values of this proxy to match it.
@@ -1098,17 +1302,15 @@ class Proxy:
         Returns:
             Proxy: This object (self)
         """
+        self._dict_cache = None
         if proxy_dict and not isinstance(proxy_dict, dict):
             logger.debug(f"Unable o read data from dict. Input must be a dictionary.")
             return
 
-        _name = proxy_dict.get("name")
-        if _name:
-            self.set_name(name=_name)
-
-        _parent = proxy_dict.get("parent")
-        if _parent:
-            self.set_parent_uuid(uuid=_parent)
+        for key, setter in self._DICT_SETTERS:
+            value = proxy_dict.get(key)
+            if value:
+                getattr(self, setter)(value)
 
         transform = proxy_dict.get("transform")
         if transform and len(transform) == 3:
@@ -1118,19 +1320,7 @@ class Proxy:
         offset_transform = proxy_dict.get("offsetTransform")
         if offset_transform and len(offset_transform) == 3:
             self._initialize_offset_transform()
-            self.offset_transform.set_transform_from_dict(transform_dict=transform)
-
-        attributes = proxy_dict.get("attributes")
-        if attributes:
-            self.set_attr_dict(attr_dict=attributes)
-
-        metadata = proxy_dict.get("metadata")
-        if metadata:
-            self.set_metadata_dict(metadata=metadata)
-
-        _uuid = proxy_dict.get("uuid")
-        if _uuid:
-            self.set_uuid(uuid=_uuid)
+            self.offset_transform.set_transform_from_dict(transform_dict=offset_transform)
         return self
 
     def read_data_from_scene(self):
@@ -1141,20 +1331,21 @@ class Proxy:
         Returns:
             Proxy: This object (self)
         """
+        self._dict_cache = None
         ignore_attr_list = [
             tools_rig_const.RiggerConstants.ATTR_PROXY_UUID,
         ]
-        proxy = core_uuid.get_object_from_uuid_attr(
-            uuid_string=self.uuid, attr_name=tools_rig_const.RiggerConstants.ATTR_PROXY_UUID
-        )
+        proxy = tools_rig_utils.find_proxy_from_uuid(self.uuid)  # Scene scan, unless a "SceneLookupCache" is active
         if proxy:
+            proxy = str(proxy)
             try:
                 self._initialize_transform()
                 self.transform.set_transform_from_object(proxy)
                 attr_dict = {}
                 user_attrs = core_attr.list_user_defined_attr(proxy, skip_nested=True, skip_parents=False) or []
+                locked_attrs = set(cmds.listAttr(proxy, userDefined=True, locked=True) or [])  # One query for all
                 for attr in user_attrs:
-                    if not cmds.getAttr(f"{proxy}.{attr}", lock=True) and attr not in ignore_attr_list:
+                    if attr not in locked_attrs and attr not in ignore_attr_list:
                         attr_dict[attr] = core_attr.get_attr(f"{proxy}.{attr}")
                 if attr_dict:
                     self.set_attr_dict(attr_dict=attr_dict)
@@ -1230,7 +1421,7 @@ class Proxy:
             dict: a dictionary where the key is the attribute name and the value is the value of the attribute.
                   e.g. {"locatorScale": 1, "isVisible": True}
         """
-        return self.attr_dict
+        return self.attr_dict or {}
 
     def get_attr_dict_value(self, key, default=None):
         """
@@ -1242,6 +1433,8 @@ class Proxy:
             any: Any data stored as a value for the provided key. If a key is not found the default
             parameter is returned instead.
         """
+        if not self.attr_dict:
+            return default
         return self.attr_dict.get(key, default)
 
     def get_locator_scale(self):
@@ -1277,15 +1470,19 @@ class Proxy:
             include_transform_data (bool, optional): If True, it will also export the transform data.
             include_offset_data (bool, optional): If True, it will also export the offset transform data.
         Returns:
-            dict: Proxy data as a dictionary
+            dict: Proxy data as a dictionary (shallow copy of a cached dictionary, rebuilt after the proxy changes)
         """
-        # Create Proxy Data
-        proxy_data = {"name": self.name}
-
-        if include_uuid and self.get_uuid():
-            proxy_data["uuid"] = self.get_uuid()
+        cache_key = (bool(include_uuid), bool(include_transform_data), bool(include_offset_data))
+        if self._dict_cache is None:
+            self._dict_cache = {}
+        elif cache_key in self._dict_cache:
+            return dict(self._dict_cache[cache_key])
 
-        proxy_data["parent"] = self.get_parent_uuid()  # Add later to determine order
+        # Create Proxy Data (Fields are read once, optional keys are only added when populated)
+        if include_uuid and self.uuid:
+            proxy_data = {"name": self.name, "uuid": self.uuid, "parent": self.parent_uuid}
+        else:
+            proxy_data = {"name": self.name, "parent": self.parent_uuid}
 
         if self.transform and include_transform_data:
             proxy_data["transform"] = self.transform.get_transform_as_dict()
@@ -1293,13 +1490,14 @@ class Proxy:
         if self.offset_transform and include_offset_data:
             proxy_data["offsetTransform"] = self.offset_transform.get_transform_as_dict()
 
-        if self.get_attr_dict():
-            proxy_data["attributes"] = self.get_attr_dict()
+        if self.attr_dict:
+            proxy_data["attributes"] = self.attr_dict
 
-        if self.get_metadata():
-            proxy_data["metadata"] = self.get_metadata()
+        if self.metadata:
+            proxy_data["metadata"] = self.metadata
 
-        return proxy_data
+        self._dict_cache[cache_key] = proxy_data
+        return dict(proxy_data)
 
 
 class ModuleGeneric:
@@ -1307,6 +1505,23 @@ class ModuleGeneric:
     icon = ui_res_lib.Icon.rigger_module_generic
     allow_parenting = True
     allow_multiple = True
+    _class_name = "ModuleGeneric"  # Class name, defined for every subclass by "__init_subclass__"
+    _class_name_no_prefix = "Generic"  # Class name without the "Module" prefix, also defined by "__init_subclass__"
+    _DICT_SETTERS = (  # Module dictionary key and the setter used to read it. (Other keys are read separately)
+        ("name", "set_name"),
+        ("uuid", "set_uuid"),
+        ("prefix", "set_prefix"),
+        ("suffix", "set_suffix"),
+        ("parent", "set_parent_uuid"),
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Stores the class name variations used by "get_module_class_name" when a new module class is defined.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._class_name = cls.__name__
+        cls._class_name_no_prefix = core_str.remove_prefix(input_string=cls.__name__, prefix="Module")
 
     def __init__(self, name=None, prefix=None, suffix=None):
         # Default Values
@@ -1339,7 +1554,7 @@ class ModuleGeneric:
             name (str): New name to use on the proxy.
         """
         if name is None or not isinstance(name, str):
-            logger.warning(f'Unable to set name. Expected string but got "{str(type(name))}"')
+            logger.warning('Unable to set name. Expected string but got "%s"', type(name))
             return
         self.name = name
 
@@ -1367,7 +1582,7 @@ class ModuleGeneric:
             prefix (str): New prefix to use on the proxy.
         """
         if prefix is None or not isinstance(prefix, str):
-            logger.warning(f'Unable to set prefix. Expected string but got "{str(type(prefix))}"')
+            logger.warning('Unable to set prefix. Expected string but got "%s"', type(prefix))
             return
         self.prefix = prefix
 
@@ -1378,7 +1593,7 @@ class ModuleGeneric:
             suffix (str): New suffix to use on the proxy.
         """
         if suffix is None or not isinstance(suffix, str):
-            logger.warning(f'Unable to set prefix. Expected string but got "{str(type(suffix))}"')
+            logger.warning('Unable to set suffix. Expected string but got "%s"', type(suffix))
             return
         self.suffix = suffix
 
@@ -1393,7 +1608,7 @@ class ModuleGeneric:
         if not uuid or not isinstance(uuid, str):
             logger.warning(error_message)
             return
-        if core_uuid.is_uuid_valid(uuid) or core_uuid.is_short_uuid_valid(uuid):
+        if core_uuid.is_uuid_valid_any(uuid):
             self.parent_uuid = uuid
         else:
             logger.warning(error_message)
@@ -1405,9 +1620,7 @@ class ModuleGeneric:
             proxy_list (List[Proxy]): New list of proxies.
         """
         if not proxy_list or not isinstance(proxy_list, list):
-            logger.warning(
-                f"Unable to set new list of proxies. " f'Expected list of proxies but got "{str(proxy_list)}"'
-            )
+            logger.warning('Unable to set new list of proxies. Expected list of proxies but got "%s"', proxy_list)
             return
         self.proxies = proxy_list
 
@@ -1418,14 +1631,16 @@ class ModuleGeneric:
         Args:
             proxy (Proxy, List[Proxy]): New proxy element to be added to this module or a list of proxies
         """
-        if proxy and isinstance(proxy, Proxy):
-            proxy = [proxy]
-        if proxy and isinstance(proxy, list):
-            for obj in proxy:
-                if isinstance(obj, Proxy):
-                    self.proxies.append(obj)
-                else:
-                    logger.debug(f'Unable to add "{str(obj)}". Incompatible type.')
+        if isinstance(proxy, Proxy):  # Common case, single proxy
+            self.proxies.append(proxy)
+            return
+        if proxy and isinstance(proxy, (list, tuple)):
+            valid_proxies = [obj for obj in proxy if isinstance(obj, Proxy)]
+            if len(valid_proxies) != len(proxy):
+                for obj in proxy:
+                    if not isinstance(obj, Proxy):
+                        logger.debug('Unable to add "%s". Incompatible type.', obj)
+            self.proxies.extend(valid_proxies)
             return
         logger.debug(
             f"Unable to add proxy to module. " f'Must be of the type "Proxy" or a list containing only Proxy elements.'
@@ -1468,9 +1683,7 @@ class ModuleGeneric:
             metadata (dict): A dictionary describing extra information about the curve
         """
         if not isinstance(metadata, dict):
-            logger.warning(
-                f"Unable to set module metadata. " f'Expected a dictionary, but got: "{str(type(metadata))}"'
-            )
+            logger.warning('Unable to set module metadata. Expected a dictionary, but got: "%s"', type(metadata))
             return
         self.metadata = metadata
 
@@ -1481,7 +1694,7 @@ class ModuleGeneric:
             is_active (bool): True if active, False if inactive. Inactive modules are ignored when in a project.
         """
         if not isinstance(is_active, bool):
-            logger.warning(f"Unable to set active state. " f'Expected a boolean, but got: "{str(type(is_active))}"')
+            logger.warning('Unable to set active state. Expected a boolean, but got: "%s"', type(is_active))
             return
         self.active = is_active
 
@@ -1553,8 +1766,7 @@ class ModuleGeneric:
             key (str): Key of the new metadata element
             value (Any): Value of the new metadata element
         """
-        if not self.metadata:  # Initialize metadata in case it was never used.
-            self.metadata = {}
+        self.metadata = self.metadata or {}  # Initialize metadata in case it was never used.
         self.metadata[key] = value
 
     def clear_parent_uuid(self):
@@ -1647,10 +1859,7 @@ class ModuleGeneric:
 
         self.proxies = []
         for uuid, description in proxy_dict.items():
-            _proxy = Proxy()
-            _proxy.set_uuid(uuid)
-            _proxy.read_data_from_dict(proxy_dict=description)
-            self.proxies.append(_proxy)
+            self.proxies.append(Proxy._from_dict_fast(proxy_dict=description, uuid=uuid))
 
     def read_data_from_dict(self, module_dict):
         """
@@ -1665,25 +1874,10 @@ class ModuleGeneric:
             logger.debug(f"Unable o read data from dict. Input must be a dictionary.")
             return
 
-        _name = module_dict.get("name")
-        if _name:
-            self.set_name(name=_name)
-
-        _uuid = module_dict.get("uuid")
-        if _uuid:
-            self.set_uuid(uuid=_uuid)
-
-        _prefix = module_dict.get("prefix")
-        if _prefix:
-            self.set_prefix(prefix=_prefix)
-
-        _suffix = module_dict.get("suffix")
-        if _suffix:
-            self.set_suffix(suffix=_suffix)
-
-        _parent = module_dict.get("parent")
-        if _parent:
-            self.set_parent_uuid(uuid=_parent)
+        for key, setter in self._DICT_SETTERS:
+            value = module_dict.get(key)
+            if value:
+                getattr(self, setter)(value)
 
         _orientation = module_dict.get("orientation")
         if _orientation:
@@ -1746,8 +1940,9 @@ class ModuleGeneric:
         Returns:
             ModuleGeneric: This object (self)
         """
-        for proxy in self.proxies:
-            proxy.read_data_from_scene()
+        with tools_rig_utils.SceneLookupCache():
+            for proxy in self.proxies:
+                proxy.read_data_from_scene()
         return self
 
     # ------------------------------------------------- Getters -------------------------------------------------
@@ -1882,29 +2077,29 @@ class ModuleGeneric:
         """
         module_data = {}
         if include_module_name:
-            module_name = self.get_module_class_name(remove_module_prefix=False)
-            module_data["module"] = module_name
-        if self.name:
-            module_data["name"] = self.name
+            module_data["module"] = self.get_module_class_name(remove_module_prefix=False)
+        name, prefix, suffix, parent_uuid = self.name, self.prefix, self.suffix, self.parent_uuid
+        if name:
+            module_data["name"] = name
         module_data["uuid"] = self.uuid
         module_data["active"] = self.active
-        if self.prefix:
-            module_data["prefix"] = self.prefix
-        if self.suffix:
-            module_data["suffix"] = self.suffix
-        if self.parent_uuid:
-            module_data["parent"] = self.parent_uuid
-        if self.orientation:
-            module_data["orientation"] = self.orientation.get_data_as_dict()
-        if self.code:
-            module_data["code"] = self.code.get_data_as_dict()
-        if self.metadata:
-            module_data["metadata"] = self.metadata
+        if prefix:
+            module_data["prefix"] = prefix
+        if suffix:
+            module_data["suffix"] = suffix
+        if parent_uuid:
+            module_data["parent"] = parent_uuid
+        orientation, code, metadata = self.orientation, self.code, self.metadata
+        if orientation:
+            module_data["orientation"] = orientation.get_data_as_dict()
+        if code:
+            module_data["code"] = code.get_data_as_dict()
+        if metadata:
+            module_data["metadata"] = metadata
         module_data.update(self._get_serialized_attrs())  # Gets any extra attributes defined in extended modules
-        module_proxies = {}
-        for proxy in self.proxies:
-            module_proxies[proxy.get_uuid()] = proxy.get_proxy_as_dict(include_offset_data=include_offset_data)
-        module_data["proxies"] = module_proxies
+        module_data["proxies"] = {
+            proxy.uuid: proxy.get_proxy_as_dict(include_offset_data=include_offset_data) for proxy in self.proxies
+        }
         return module_data
 
     def get_module_class_name(self, remove_module_prefix=False, formatted=False, remove_side=False):
@@ -1919,9 +2114,7 @@ class ModuleGeneric:
         Returns:
             str: Class name as a string.
         """
-        _module_class_name = str(self.__class__.__name__)
-        if remove_module_prefix:
-            _module_class_name = core_str.remove_prefix(input_string=str(self.__class__.__name__), prefix="Module")
+        _module_class_name = self._class_name_no_prefix if remove_module_prefix else self._class_name
         if formatted:
             _module_class_name = " ".join(core_str.camel_case_split(_module_class_name))
         if remove_side:
@@ -2038,7 +2231,7 @@ class ModuleGeneric:
             e.g. A class has an attribute "self.ctrl_visibility" set to True. This function will return:
             {"ctrl_visibility": True}, which can be serialized.
         """
-        _manually_serialized = tools_rig_const.RiggerConstants.CLASS_ATTR_SKIP_AUTO_SERIALIZATION
+        _manually_serialized = set(tools_rig_const.RiggerConstants.CLASS_ATTR_SKIP_AUTO_SERIALIZATION)
         _result = {}
         for key, value in self.__dict__.items():
             if key not in _manually_serialized and not key.startswith("_"):
@@ -2132,8 +2325,9 @@ class ModuleGeneric:
         Args:
             apply_offset (bool, optional): If True, it will attempt to also apply the offset data. (Happens first)
         """
-        for proxy in self.proxies:
-            proxy.apply_transforms(apply_offset=apply_offset)
+        with tools_rig_utils.SceneLookupCache():
+            for proxy in self.proxies:
+                proxy.apply_transforms(apply_offset=apply_offset)
 
     def is_valid(self):
         """
@@ -2526,22 +2720,22 @@ class ModuleGeneric:
         Returns:
             list: A list of ProxyData objects. These objects describe the created proxy elements.
         """
-        logger.debug(f'"build_proxy" function for "{self.get_module_class_name()}" was called.')
-        proxy_data = []
-        _prefix = ""
-        prefix_list = []
-
-        if project_prefix and isinstance(project_prefix, str):
-            prefix_list.append(project_prefix)
-        if self.prefix and isinstance(self.prefix, str):
-            prefix_list.append(self.prefix)
-        if prefix_list:
-            _prefix = "_".join(prefix_list)
-        for proxy in self.proxies:
-            proxy_data.append(
-                proxy.build(prefix=_prefix, suffix=self.suffix, apply_transforms=False, optimized=optimized)
-            )
-        return proxy_data
+        logger.debug('"build_proxy" function for "%s" was called.', self._class_name)
+        has_project_prefix = bool(project_prefix) and isinstance(project_prefix, str)
+        has_module_prefix = bool(self.prefix) and isinstance(self.prefix, str)
+        if has_project_prefix and has_module_prefix:
+            _prefix = f"{project_prefix}_{self.prefix}"
+        elif has_project_prefix:
+            _prefix = project_prefix
+        elif has_module_prefix:
+            _prefix = self.prefix
+        else:
+            _prefix = ""
+        suffix = self.suffix
+        return [
+            proxy.build(prefix=_prefix, suffix=suffix, apply_transforms=False, optimized=optimized)
+            for proxy in self.proxies
+        ]
 
     def build_proxy_setup(self):
         """
@@ -2549,7 +2743,7 @@ class ModuleGeneric:
         This step runs after the execution of "build_proxy" is complete in all modules.
         Usually used to create extra behavior unique to the module. e.g. Constraints, automations, or limitations.
         """
-        logger.debug(f'"build_proxy_setup" function for "{self.get_module_class_name()}" was called.')
+        logger.debug('"build_proxy_setup" function for "%s" was called.', self._class_name)
         self.apply_transforms()
 
     def build_skeleton_joints(self):
@@ -2557,62 +2751,59 @@ class ModuleGeneric:
         Runs build skeleton joints script. Creates joints out of the proxy elements.
         This function should happen after "build_proxy_setup" as it expects proxy elements to be present in the scene.
         """
-        logger.debug(f'"build_skeleton" function from "{self.get_module_class_name()}" was called.')
+        logger.debug('"build_skeleton" function from "%s" was called.', self._class_name)
         skeleton_grp = tools_rig_utils.find_skeleton_group()
-        for proxy in self.proxies:
-            proxy_node = tools_rig_utils.find_proxy_from_uuid(proxy.get_uuid())
-            if not proxy_node:
-                continue
+        joint_proxy_pairs = []
+        with tools_rig_utils.SceneLookupCache():
+            for proxy in self.proxies:
+                proxy_node = tools_rig_utils.find_proxy_from_uuid(proxy.get_uuid())
+                if not proxy_node:
+                    continue
 
-            joint_name = f"{proxy_node.get_short_name()}_{core_naming.NamingConstants.Suffix.JNT}"
-            joint = core_node.create_node(node_type="joint", name=joint_name)
+                joint_name = f"{proxy_node.get_short_name()}_{core_naming.NamingConstants.Suffix.JNT}"
+                joint = core_node.create_node(node_type="joint", name=joint_name)
 
-            _locator_scale = proxy.get_locator_scale()
-            cmds.setAttr(f"{joint}.radius", _locator_scale)
-            _rot_order = proxy.get_rotation_order()
-            cmds.setAttr(f"{joint}.rotateOrder", _rot_order)
-            core_trans.match_translate(source=proxy_node, target_list=joint)
+                cmds.setAttr(f"{joint}.radius", proxy.get_locator_scale())
+                cmds.setAttr(f"{joint}.rotateOrder", proxy.get_rotation_order())
+                core_trans.match_translate(source=proxy_node, target_list=joint)
+                joint_proxy_pairs.append((joint, proxy))
+        if not joint_proxy_pairs:
+            return
 
-            # Add proxy base name - Proxy/Joint Name
-            core_attr.add_attr(
-                obj_list=joint, attributes=tools_rig_const.RiggerConstants.ATTR_JOINT_BASE_NAME, attr_type="string"
-            )
-            core_attr.set_attr(
-                obj_list=joint, attr_list=tools_rig_const.RiggerConstants.ATTR_JOINT_BASE_NAME, value=proxy.get_name()
-            )
-            # Add proxy reference - Proxy/Joint UUID
-            core_attr.add_attr(
-                obj_list=joint, attributes=tools_rig_const.RiggerConstants.ATTR_JOINT_UUID, attr_type="string"
-            )
-            core_attr.set_attr(
-                obj_list=joint, attr_list=tools_rig_const.RiggerConstants.ATTR_JOINT_UUID, value=proxy.get_uuid()
-            )
-            # Add module reference - Module UUID
-            core_attr.add_attr(
-                obj_list=joint, attributes=tools_rig_const.RiggerConstants.ATTR_MODULE_UUID, attr_type="string"
-            )
-            core_attr.set_attr(
-                obj_list=joint, attr_list=tools_rig_const.RiggerConstants.ATTR_MODULE_UUID, value=self.get_uuid()
-            )
-            # Add proxy purposes - Meta Purpose
-            core_attr.add_attr(
-                obj_list=joint, attributes=tools_rig_const.RiggerConstants.ATTR_JOINT_PURPOSE, attr_type="string"
-            )
-            core_attr.set_attr(
-                obj_list=joint,
-                attr_list=tools_rig_const.RiggerConstants.ATTR_JOINT_PURPOSE,
-                value=proxy.get_meta_purpose(),
-            )
-            # Add proxy purposes - Joint Drivers
-            core_attr.add_attr(
-                obj_list=joint, attributes=tools_rig_const.RiggerConstants.ATTR_JOINT_DRIVERS, attr_type="string"
+        # Add joint metadata attributes in a single pass (Base Name, UUIDs, Purpose and Drivers)
+        joints = [joint for joint, _ in joint_proxy_pairs]
+        core_attr.add_attr(
+            obj_list=joints,
+            attributes=[
+                tools_rig_const.RiggerConstants.ATTR_JOINT_BASE_NAME,
+                tools_rig_const.RiggerConstants.ATTR_JOINT_UUID,
+                tools_rig_const.RiggerConstants.ATTR_MODULE_UUID,
+                tools_rig_const.RiggerConstants.ATTR_JOINT_PURPOSE,
+                tools_rig_const.RiggerConstants.ATTR_JOINT_DRIVERS,
+            ],
+            attr_type="string",
+        )
+        module_uuid = self.get_uuid()
+        for joint, proxy in joint_proxy_pairs:
+            string_values = (
+                (tools_rig_const.RiggerConstants.ATTR_JOINT_BASE_NAME, proxy.get_name()),
+                (tools_rig_const.RiggerConstants.ATTR_JOINT_UUID, proxy.get_uuid()),
+                (tools_rig_const.RiggerConstants.ATTR_MODULE_UUID, module_uuid),
+                (tools_rig_const.RiggerConstants.ATTR_JOINT_PURPOSE, proxy.get_meta_purpose()),
             )
+            for attr_name, value in string_values:
+                if value is None:
+                    continue
+                try:
+                    cmds.setAttr(f"{joint}.{attr_name}", value, typ="string")
+                except Exception as e:
+                    logger.debug(f'Unable to set "{attr_name}" on "{joint}". Issue: {e}')
             drivers = proxy.get_driver_types()
             if drivers:
                 tools_rig_utils.add_driver_to_joint(target_joint=joint, new_drivers=drivers)
 
-            core_color.set_color_viewport(obj_list=joint, rgb_color=core_color.ColorConstants.RigJoint.GENERAL)
-            core_hrchy.parent(source_objects=joint, target_parent=str(skeleton_grp))
+        core_color.set_color_viewport(obj_list=joints, rgb_color=core_color.ColorConstants.RigJoint.GENERAL)
+        core_hrchy.parent(source_objects=joints, target_parent=str(skeleton_grp))
 
     def build_skeleton_hierarchy(self):
         """
@@ -2624,27 +2815,31 @@ class ModuleGeneric:
             This fixes incorrect aim target orientation, because the last object simply
             inherits the orientation from its parent instead of looking at their children.
         """
-        logger.debug(f'"build_skeleton_hierarchy" function from "{self.get_module_class_name()}" was called.')
+        logger.debug('"build_skeleton_hierarchy" function from "%s" was called.', self._class_name)
         module_uuids = self.get_proxies_uuids()
+        joints_by_uuid = tools_rig_utils.get_joints_by_uuid()
         jnt_nodes = []
-        for proxy in self.proxies:
-            joint = tools_rig_utils.find_joint_from_uuid(proxy.get_uuid())
-            if not joint:
-                continue
+        with tools_rig_utils.SceneLookupCache():
+            for proxy in self.proxies:
+                joint = joints_by_uuid.get(proxy.get_uuid())
+                if not joint:
+                    continue
 
-            proxy_obj_path = tools_rig_utils.find_proxy_from_uuid(proxy.get_uuid())
-            # Inherit Orientation (Before Parenting)
-            if self.get_orientation_method() == OrientationData.Methods.inherit:
-                core_trans.match_rotate(source=proxy_obj_path, target_list=joint)
-            # Inherit Rotation Order
-            proxy_rotation_order = cmds.getAttr(f"{proxy_obj_path}.{tools_rig_const.RiggerConstants.ATTR_ROT_ORDER}")
-            cmds.setAttr(f"{joint}.rotateOrder", proxy_rotation_order)
-            # Parent Joint (Internal Proxies)
-            parent_uuid = proxy.get_parent_uuid()
-            if parent_uuid in module_uuids:
-                parent_joint_node = tools_rig_utils.find_joint_from_uuid(parent_uuid)
-                core_hrchy.parent(source_objects=joint, target_parent=parent_joint_node)
-            jnt_nodes.append(joint)
+                proxy_obj_path = tools_rig_utils.find_proxy_from_uuid(proxy.get_uuid())
+                # Inherit Orientation (Before Parenting)
+                if self.get_orientation_method() == OrientationData.Methods.inherit:
+                    core_trans.match_rotate(source=proxy_obj_path, target_list=joint)
+                # Inherit Rotation Order
+                proxy_rotation_order = cmds.getAttr(
+                    f"{proxy_obj_path}.{tools_rig_const.RiggerConstants.ATTR_ROT_ORDER}"
+                )
+                cmds.setAttr(f"{joint}.rotateOrder", proxy_rotation_order)
+                # Parent Joint (Internal Proxies)
+                parent_uuid = proxy.get_parent_uuid()
+                if parent_uuid in module_uuids:
+                    parent_joint_node = joints_by_uuid.get(parent_uuid)
+                    core_hrchy.parent(source_objects=joint, target_parent=parent_joint_node)
+                jnt_nodes.append(joint)
 
         # Auto Orientation (After Parenting)
         if self.get_orientation_method() == OrientationData.Methods.automatic:
@@ -2654,8 +2849,8 @@ class ModuleGeneric:
         for proxy in self.proxies:
             parent_uuid = proxy.get_parent_uuid()
             if parent_uuid not in module_uuids:
-                joint = tools_rig_utils.find_joint_from_uuid(proxy.get_uuid())
-                parent_joint_node = tools_rig_utils.find_joint_from_uuid(parent_uuid)
+                joint = joints_by_uuid.get(proxy.get_uuid())
+                parent_joint_node = joints_by_uuid.get(parent_uuid)
                 core_hrchy.parent(source_objects=joint, target_parent=parent_joint_node)
         cmds.select(clear=True)
 
@@ -2673,7 +2868,7 @@ class ModuleGeneric:
                                             Module prefix is the prefix stored in this module "self.prefix"
                                             Module suffix is the suffix stored in this module "self.suffix"
         """
-        logger.debug(f'"build_rig" function from "{self.get_module_class_name()}" was called.')
+        logger.debug('"build_rig" function from "%s" was called.', self._class_name)
 
     def build_rig_post(self):
         """
@@ -2681,11 +2876,31 @@ class ModuleGeneric:
         This step runs after the execution of "build_rig" is complete in all modules.
         Used to define automation or connections that require external elements to exist.
         """
-        logger.debug(f'"build_rig" function from "{self.get_module_class_name()}" was called.')
+        logger.debug('"build_rig" function from "%s" was called.', self._class_name)
         self._parent_module_children_drivers()
 
 
+_RIG_MODULES_DICT = None  # Module class name to class, filled on first use by "_get_rig_modules_dict"
+
+
+def _get_rig_modules_dict():
+    """
+    Gets the available modules (RigModules) as a dictionary. Collected only once, then reused.
+    "RigModules" is imported on first use as it depends on this module.
+    Returns:
+        dict: Dictionary where the key is the name of the module and value is the class.
+              e.g. 'ModuleBipedArm': <class 'ModuleBipedArm'>
+    """
+    global _RIG_MODULES_DICT
+    if _RIG_MODULES_DICT is None:
+        from gt.tools.auto_rigger.rig_modules import RigModules
+
+        _RIG_MODULES_DICT = RigModules.get_dict_modules()
+    return _RIG_MODULES_DICT
+
+
 class RigProject:
+    __slots__ = ("name", "prefix", "modules", "preferences")
     icon = ui_res_lib.Icon.rigger_project
 
     def __init__(self, name=None, prefix=None, preferences=None):
@@ -2710,7 +2925,7 @@ class RigProject:
             name (str): New name to use on the proxy.
         """
         if name is None or not isinstance(name, str):
-            logger.warning(f'Unable to set name. Expected string but got "{str(type(name))}"')
+            logger.warning('Unable to set name. Expected string but got "%s"', type(name))
             return
         self.name = name
 
@@ -2721,7 +2936,7 @@ class RigProject:
             prefix (str): New name to use on the proxy.
         """
         if prefix is None or not isinstance(prefix, str):
-            logger.warning(f'Unable to set prefix. Expected string but got "{str(type(prefix))}"')
+            logger.warning('Unable to set prefix. Expected string but got "%s"', type(prefix))
             return
         self.prefix = prefix
 
@@ -2732,7 +2947,7 @@ class RigProject:
             modules (list): A list of modules (ModuleGeneric as base)
         """
         if modules is None or not isinstance(modules, list):
-            logger.warning(f'Unable to set modules list. Expected a list but got "{str(type(modules))}"')
+            logger.warning('Unable to set modules list. Expected a list but got "%s"', type(modules))
             return
         self.modules = modules
         self.refresh_modules_project_reference()
@@ -2745,19 +2960,20 @@ class RigProject:
             set_parent_project (bool, optional): If True, the function also update the rig project parent,
                                                  otherwise only add to the project.
         """
-        from gt.tools.auto_rigger.rig_modules import RigModules
-
-        all_modules = RigModules.get_module_names()
-        if module and str(module.__class__.__name__) in all_modules:
-            module = [module]
-        if module and isinstance(module, list):
+        all_modules = _get_rig_modules_dict()  # Dictionary keys for constant time membership checks
+        if module.__class__.__name__ in all_modules:  # Common case, single module
+            self.modules.append(module)
+            if set_parent_project:
+                module.set_parent_project(rig_project=self)
+            return
+        if module and isinstance(module, (list, tuple)):
             for mod in module:
-                if str(mod.__class__.__name__) in all_modules:
+                if mod.__class__.__name__ in all_modules:
                     self.modules.append(mod)
                     if set_parent_project:
                         mod.set_parent_project(rig_project=self)
                 else:
-                    logger.debug(f'Unable to add "{str(mod)}". Provided module not found in "RigModules".')
+                    logger.debug('Unable to add "%s". Provided module not found in "RigModules".', mod)
             return
         logger.debug(
             f"Unable to add provided module to rig project. "
@@ -2787,8 +3003,9 @@ class RigProject:
         """
         if not isinstance(preferences, (dict, RigPreferencesData)):
             logger.warning(
-                f"Unable to set rig project metadata. "
-                f'Expected a dictionary or a RigPreferencesData object, but got: "{str(type(preferences))}"'
+                "Unable to set rig project metadata. "
+                'Expected a dictionary or a RigPreferencesData object, but got: "%s"',
+                type(preferences),
             )
             return
         if isinstance(preferences, RigPreferencesData):
@@ -2843,16 +3060,9 @@ class RigProject:
             return
 
         self.modules = []
-        from gt.tools.auto_rigger.rig_modules import RigModules
-
-        available_modules = RigModules.get_dict_modules()
+        available_modules = _get_rig_modules_dict()
         for module_description in modules_list:
-            class_name = module_description.get("module")
-            if class_name in available_modules:
-                _module = available_modules.get(class_name)()
-            else:
-                _module = ModuleGeneric()
-
+            _module = available_modules.get(module_description.get("module"), ModuleGeneric)()  # Unknown: Generic
             _module.read_data_from_dict(module_dict=module_description)
             self.modules.append(_module)
         self.refresh_modules_project_reference()
@@ -2900,8 +3110,9 @@ class RigProject:
         Returns:
             RigProject: This object (self)
         """
-        for module in self.modules:
-            module.read_data_from_scene()
+        with tools_rig_utils.SceneLookupCache():  # Nested module caches reuse this one
+            for module in self.modules:
+                module.read_data_from_scene()
         return self
 
     # ------------------------------------------------- Getters -------------------------------------------------
@@ -2929,6 +3140,14 @@ class RigProject:
         """
         return self.modules
 
+    def get_active_modules(self):
+        """
+        Gets the active modules of this rig project. (Build steps skip inactive modules)
+        Returns:
+            list: A list of modules found in this project that are active
+        """
+        return [module for module in self.modules if module.active]
+
     def get_module_from_proxy_uuid(self, uuid):
         """
         Returns a module in case a proxy with the provided UUID is found within this project.
@@ -2939,6 +3158,20 @@ class RigProject:
             if module.get_proxy_uuid_existence(uuid):
                 return module
 
+    def get_modules_by_proxy_uuid(self):
+        """
+        Gets an index of all proxy UUIDs in this project pointing to the module containing them.
+        Same as calling "get_module_from_proxy_uuid" for each UUID, without looping through all modules every time.
+        Not cached, build it once per operation (modules and proxies can change in-between operations).
+        Returns:
+            dict: Proxy UUIDs as keys and the modules containing them as values. e.g. {"1234...": <ModuleGeneric>}
+        """
+        modules_by_uuid = {}
+        for module in self.modules:
+            for proxy_uuid in module.get_proxies_uuids():
+                modules_by_uuid.setdefault(proxy_uuid, module)  # First module wins, same as the lookup
+        return modules_by_uuid
+
     def get_preferences(self):
         """
         Gets the RigPreferencesData object for this project.
@@ -2965,9 +3198,7 @@ class RigProject:
         Returns:
             dict: Dictionary describing this project.
         """
-        project_modules = []
-        for module in self.modules:
-            project_modules.append(module.get_module_as_dict())
+        project_modules = [module.get_module_as_dict() for module in self.modules]
 
         project_data = {}
         if self.name:
@@ -3034,11 +3265,12 @@ class RigProject:
         """
         # Create Topological Hierarchy
         updated_modules = self.get_modules()
+        modules_by_uuid = self.get_modules_by_proxy_uuid()
         for module in self.get_modules():
             parent_proxy_uuid = module.get_parent_uuid()
             if not parent_proxy_uuid or not isinstance(parent_proxy_uuid, str):
                 continue
-            parent_module = self.get_module_from_proxy_uuid(parent_proxy_uuid)
+            parent_module = modules_by_uuid.get(parent_proxy_uuid)
             if module == parent_module:
                 continue
             if parent_module:
@@ -3072,9 +3304,9 @@ class RigProject:
         """
         Builds Proxy/Guide Armature. This later becomes the skeleton that is driven by the rig controls.
         """
-        cmds.refresh(suspend=True)
-        try:
+        with _SuspendedViewport(), _SuspendedEvaluation(chunk_name="build_proxy"):
             self.execute_modules_code(CodeData.Order.pre_proxy)  # Try to run any pre-proxy code.
+            active_modules = self.get_active_modules()  # Collected after pre-proxy code, which may change them
             root_group = tools_rig_utils.create_root_group(is_proxy=True)
             root_transform = tools_rig_utils.create_ctrl_proxy_global()
             core_hrchy.parent(source_objects=root_transform, target_parent=root_group)
@@ -3089,9 +3321,7 @@ class RigProject:
 
             # Build Proxy
             proxy_data_list = []
-            for module in self.modules:
-                if not module.is_active():  # If not active, skip
-                    continue
+            for module in active_modules:
                 proxy_data_list += module.build_proxy(optimized=optimized)
 
             for proxy_data in proxy_data_list:
@@ -3100,45 +3330,37 @@ class RigProject:
                 core_hrchy.parent(source_objects=proxy_data.get_offset(), target_parent=root_transform)
 
             # Parent Proxy
-            for module in self.modules:
-                if not module.is_active():  # If not active, skip
-                    continue
-                tools_rig_utils.parent_proxies(proxy_list=module.get_proxies())
-                if not optimized:
-                    tools_rig_utils.create_proxy_visualization_lines(
-                        proxy_list=module.get_proxies(), lines_parent=line_grp
-                    )
-                for proxy in module.get_proxies():
-                    proxy.apply_attr_dict()
-            for module in self.modules:
-                if not module.is_active():  # If not active, skip
-                    continue
-                module.build_proxy_setup()
+            with tools_rig_utils.SceneLookupCache():
+                for module in active_modules:
+                    module_proxies = module.get_proxies()
+                    tools_rig_utils.parent_proxies(proxy_list=module_proxies)
+                    if not optimized:
+                        tools_rig_utils.create_proxy_visualization_lines(
+                            proxy_list=module_proxies, lines_parent=line_grp
+                        )
+                    for proxy in module_proxies:
+                        proxy.apply_attr_dict()
+                # Setup runs in a separate pass, as it may depend on proxies from other modules being in place
+                for module in active_modules:
+                    module.build_proxy_setup()
 
             cmds.select(clear=True)
             self.execute_modules_code(CodeData.Order.post_proxy)  # Try to run any post-proxy code.
-        except Exception as e:
-            raise e
-        finally:
-            cmds.refresh(suspend=False)
-            cmds.refresh()
+        finalize_proxy_builds()
 
     def build_skeleton(self):
         """
         Builds project skeleton.
         """
         self.execute_modules_code(CodeData.Order.pre_skeleton)  # Try to run any pre-skeleton code.
+        active_modules = self.get_active_modules()
 
         # builds module joints
-        for module in self.modules:
-            if not module.is_active():  # If not active, skip
-                continue
+        for module in active_modules:
             module.build_skeleton_joints()
 
         # builds module skeleton hierarchy
-        for module in self.modules:
-            if not module.is_active():  # If not active, skip
-                continue
+        for module in active_modules:
             module.build_skeleton_hierarchy()
 
         self.execute_modules_code(CodeData.Order.post_skeleton)  # Try to run any post-skeleton code.
@@ -3147,59 +3369,58 @@ class RigProject:
         """
         Builds Rig using Proxy/Guide Armature/Skeleton (from previous step (build_proxy)
         """
-        cmds.refresh(suspend=True)
-        try:
-            root_group = tools_rig_utils.create_root_group()
-            global_ctrl = tools_rig_utils.create_ctrl_global()
-            global_offset_ctrl = tools_rig_utils.create_ctrl_global_offset()
-            category_groups = tools_rig_utils.create_utility_groups(
-                geometry=True, skeleton=True, control=True, setup=True, target_parent=root_group
-            )
-            control_grp = category_groups.get(tools_rig_const.RiggerConstants.REF_ATTR_CONTROL)
-            skeleton_grp = category_groups.get(tools_rig_const.RiggerConstants.REF_ATTR_SKELETON)
-            setup_grp = category_groups.get(tools_rig_const.RiggerConstants.REF_ATTR_SETUP)
-            core_hrchy.parent(source_objects=list(category_groups.values()), target_parent=root_group)
-            core_hrchy.parent(source_objects=global_ctrl, target_parent=control_grp)
-            core_hrchy.parent(source_objects=global_offset_ctrl, target_parent=global_ctrl)
-
-            # connect Scale
-            cmds.connectAttr(f"{global_ctrl}.scale", f"{skeleton_grp}.scale")
-            cmds.connectAttr(f"{global_ctrl}.scale", f"{setup_grp}.scale")
-
-            # build skeleton
-            self.build_skeleton()
-
-            # build rig
-            if self.get_preferences_dict_value(key="build_control_rig", default=True):  # Key from RigPreferencesData
-                self.execute_modules_code(CodeData.Order.pre_control_rig)  # Try to run any pre-control-rig code.
-
-                for module in self.modules:
-                    if not module.is_active():  # If not active, skip
-                        continue
-                    module.build_rig()
-
-                # build rig post
-                for module in self.modules:
-                    if not module.is_active():  # If not active, skip
-                        continue
-                    module.build_rig_post()
-
-                self.execute_modules_code(CodeData.Order.post_control_rig)  # Try to run any pre-control-rig code.
-
-            # delete proxy
-            if self.get_preferences_dict_value(key="delete_proxy_after_build", default=True):
-                proxy_root = tools_rig_utils.find_root_group_proxy()
-                if proxy_root:
-                    cmds.delete(proxy_root)
-
-            self.execute_modules_code(CodeData.Order.post_build)  # Try to run any post_build code.
+        with _SuspendedEvaluation(chunk_name="build_rig"):
+            cmds.refresh(suspend=True)
+            try:
+                root_group = tools_rig_utils.create_root_group()
+                global_ctrl = tools_rig_utils.create_ctrl_global()
+                global_offset_ctrl = tools_rig_utils.create_ctrl_global_offset()
+                category_groups = tools_rig_utils.create_utility_groups(
+                    geometry=True, skeleton=True, control=True, setup=True, target_parent=root_group
+                )
+                control_grp = category_groups.get(tools_rig_const.RiggerConstants.REF_ATTR_CONTROL)
+                skeleton_grp = category_groups.get(tools_rig_const.RiggerConstants.REF_ATTR_SKELETON)
+                setup_grp = category_groups.get(tools_rig_const.RiggerConstants.REF_ATTR_SETUP)
+                core_hrchy.parent(source_objects=list(category_groups.values()), target_parent=root_group)
+                core_hrchy.parent(source_objects=global_ctrl, target_parent=control_grp)
+                core_hrchy.parent(source_objects=global_offset_ctrl, target_parent=global_ctrl)
+
+                # connect Scale
+                cmds.connectAttr(f"{global_ctrl}.scale", f"{skeleton_grp}.scale")
+                cmds.connectAttr(f"{global_ctrl}.scale", f"{setup_grp}.scale")
+
+                # build skeleton
+                self.build_skeleton()
+
+                # build rig (Key from RigPreferencesData)
+                if self.get_preferences_dict_value(key="build_control_rig", default=True):
+                    self.execute_modules_code(CodeData.Order.pre_control_rig)  # Try to run any pre-control-rig code.
+                    active_modules = self.get_active_modules()
+
+                    with tools_rig_utils.SceneLookupCache():  # Setup group and driven joints are found once
+                        for module in active_modules:
+                            module.build_rig()
+
+                        # build rig post
+                        for module in active_modules:
+                            module.build_rig_post()
+
+                    self.execute_modules_code(CodeData.Order.post_control_rig)  # Try to run any pre-control-rig code.
+
+                # delete proxy
+                if self.get_preferences_dict_value(key="delete_proxy_after_build", default=True):
+                    proxy_root = tools_rig_utils.find_root_group_proxy()
+                    if proxy_root:
+                        cmds.delete(proxy_root)
+
+                self.execute_modules_code(CodeData.Order.post_build)  # Try to run any post_build code.
 
-        except Exception as e:
-            raise e
-        finally:
-            cmds.refresh(suspend=False)
-            cmds.refresh()
-            cmds.select(clear=True)
+            except Exception as e:
+                raise e
+            finally:
+                cmds.refresh(suspend=False)
+                cmds.refresh()
+                cmds.select(clear=True)
 
 
 def get_environment_variables(rig_project=None):
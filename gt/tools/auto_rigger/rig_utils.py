@@ -27,21 +27,105 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+_SCENE_LOOKUP_CACHE = {}  # Lookup key to result, only populated while a "SceneLookupCache" is active
+_PROXIES_BY_UUID_KEY = ("proxies_by_uuid",)  # Cache key for the proxy UUID map used by "find_proxy_from_uuid"
+_SCENE_LOOKUP_CACHE_DEPTH = 0  # Number of active (nested) "SceneLookupCache" context managers
+
+
+class SceneLookupCache:
+    """
+    Context manager used to share scene lookups between all modules of a build.
+    While active, "find_proxy_from_uuid", "find_setup_group" and "get_driven_joint" reuse previous results instead of
+    scanning the scene on every call. Results are stored as "Node" objects and are only reused while they still exist.
+
+    Usage:
+        with SceneLookupCache():
+            for module in modules:
+                module.build_rig()
+    """
+
+    def __enter__(self):
+        global _SCENE_LOOKUP_CACHE_DEPTH
+        _SCENE_LOOKUP_CACHE_DEPTH += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _SCENE_LOOKUP_CACHE_DEPTH
+        _SCENE_LOOKUP_CACHE_DEPTH -= 1
+        if _SCENE_LOOKUP_CACHE_DEPTH == 0:
+            _SCENE_LOOKUP_CACHE.clear()
+
+
+def _get_cached_lookup(key):
+    """
+    Gets a node stored by a previous lookup while a "SceneLookupCache" is active.
+    Args:
+        key (tuple): Lookup key. e.g. ("setup_group",)
+    Returns:
+        Node or None: The stored node if the cache is active and the node still exists, otherwise None.
+    """
+    if _SCENE_LOOKUP_CACHE_DEPTH == 0:
+        return
+    node = _SCENE_LOOKUP_CACHE.get(key)
+    if node and node.exists():
+        return node
+
+
+def _set_cached_lookup(key, node):
+    """
+    Stores the result of a lookup while a "SceneLookupCache" is active. Does nothing otherwise.
+    Args:
+        key (tuple): Lookup key. e.g. ("setup_group",)
+        node (str, Node, None): Found node. Empty results are not stored.
+    """
+    if _SCENE_LOOKUP_CACHE_DEPTH and node:
+        _SCENE_LOOKUP_CACHE[key] = core_node.Node(node)
+
 
 # ------------------------------------------ Lookup functions ------------------------------------------
 def find_proxy_from_uuid(uuid_string):
     """
     Return a proxy if the provided UUID is present in the attribute RiggerConstants.PROXY_ATTR_UUID
+    While a "SceneLookupCache" is active, proxies are found through a single scene query shared by all lookups.
     Args:
         uuid_string (str): UUID to look for (if it matches, then the proxy is found)
     Returns:
         Node or None: If found, the proxy with the matching UUID, otherwise None
     """
-    proxy = core_uuid.get_object_from_uuid_attr(
+    proxies_by_uuid = None
+    if _SCENE_LOOKUP_CACHE_DEPTH:
+        proxies_by_uuid = _SCENE_LOOKUP_CACHE.get(_PROXIES_BY_UUID_KEY)
+        if proxies_by_uuid is None:
+            proxies_by_uuid = get_proxies_by_uuid()
+            _SCENE_LOOKUP_CACHE[_PROXIES_BY_UUID_KEY] = proxies_by_uuid
+        proxy = proxies_by_uuid.get(uuid_string)
+        if proxy and proxy.exists():
+            return proxy
+    proxy = core_uuid.get_object_from_uuid_attr(  # Not cached (e.g. proxy built after the cached scene query)
         uuid_string=uuid_string, attr_name=tools_rig_const.RiggerConstants.ATTR_PROXY_UUID, obj_type="transform"
     )
     if proxy:
-        return core_node.Node(proxy)
+        proxy = core_node.Node(proxy)
+        if proxies_by_uuid is not None:
+            proxies_by_uuid[uuid_string] = proxy
+        return proxy
+
+
+def get_proxies_by_uuid():
+    """
+    Maps proxy UUIDs (stored in RiggerConstants.ATTR_PROXY_UUID) to their proxies using a single scene query.
+    Used instead of calling "find_proxy_from_uuid" (a full scan) for every UUID.
+    Returns:
+        dict: Proxy UUID to proxy Node. If a UUID is repeated (e.g. duplicated proxy), the first proxy found is kept.
+    """
+    uuid_attr = tools_rig_const.RiggerConstants.ATTR_PROXY_UUID
+    proxies_by_uuid = {}
+    for attr_path in cmds.ls(f"*.{uuid_attr}", recursive=True, long=True) or []:
+        try:
+            proxies_by_uuid.setdefault(cmds.getAttr(attr_path), core_node.Node(attr_path.rsplit(".", 1)[0]))
+        except Exception as e:
+            logger.debug(f'Unable to read proxy UUID from "{attr_path}". Issue: {str(e)}')
+    return proxies_by_uuid
 
 
 def find_joint_from_uuid(uuid_string):
@@ -59,6 +143,22 @@ def find_joint_from_uuid(uuid_string):
         return core_node.Node(joint)
 
 
+def get_joints_by_uuid():
+    """
+    Maps joint UUIDs (stored in RiggerConstants.ATTR_JOINT_UUID) to their joints using a single scene scan.
+    Used instead of calling "find_joint_from_uuid" (a full scan) for every UUID.
+    Returns:
+        dict: Joint UUID to joint Node. If a UUID is repeated, the first joint found is kept (same as the scan).
+    """
+    uuid_attr = tools_rig_const.RiggerConstants.ATTR_JOINT_UUID
+    joints_by_uuid = {}
+    for jnt in cmds.ls(typ="joint", long=True) or []:
+        attr_path = f"{jnt}.{uuid_attr}"
+        if cmds.objExists(attr_path):
+            joints_by_uuid.setdefault(cmds.getAttr(attr_path), core_node.Node(jnt))
+    return joints_by_uuid
+
+
 def find_driver_from_uuid(uuid_string):
     """
     Return a transform if the provided UUID matches the value of the attribute
@@ -232,7 +332,11 @@ def find_setup_group():
     Returns:
         Node or None: The existing setup group, otherwise None.
     """
-    return find_object_with_attr(tools_rig_const.RiggerConstants.REF_ATTR_SETUP, obj_type="transform")
+    setup_grp = _get_cached_lookup(("setup_group",))
+    if not setup_grp:
+        setup_grp = find_object_with_attr(tools_rig_const.RiggerConstants.REF_ATTR_SETUP, obj_type="transform")
+        _set_cached_lookup(("setup_group",), setup_grp)
+    return setup_grp
 
 
 def find_vis_lines_from_uuid(parent_uuid=None, child_uuid=None):
@@ -633,6 +737,27 @@ def get_proxy_offset(proxy_name):
         return offset
 
 
+def get_proxy_offsets(proxy_names):
+    """
+    Return the offset transforms (parents) of the provided proxy objects using a single query.
+    Same as calling "get_proxy_offset" for each proxy. (Falls back to it if a proxy is missing or shares its parent)
+    Args:
+        proxy_names (list): Names/paths of the proxies. e.g. ["|proxy_offset|proxy", "|other_offset|other"]
+    Returns:
+        list: The offsets, in the same order as the provided proxies. "None" for proxies without an offset.
+    """
+    proxy_names = [str(proxy_name) for proxy_name in proxy_names or []]
+    if not proxy_names:
+        return []
+    try:
+        offsets = cmds.listRelatives(proxy_names, parent=True, typ="transform", fullPath=True) or []
+    except ValueError:  # Missing proxy
+        offsets = []
+    if len(offsets) == len(proxy_names):  # Parents are unique, so each proxy has exactly one (in the same order)
+        return offsets
+    return [get_proxy_offset(proxy_name) for proxy_name in proxy_names]
+
+
 def get_meta_purpose_from_dict(metadata_dict):
     """
     Gets the meta type of the proxy. A meta type helps identify the purpose of a proxy within a module.
@@ -715,9 +840,11 @@ def get_driven_joint(uuid_string, suffix=core_naming.NamingConstants.Suffix.DRIV
         Node, str: Path to the FK Driver - Node format has string as its base.
 
     """
-    driven_jnt = core_uuid.get_object_from_uuid_attr(
-        uuid_string=uuid_string, attr_name=tools_rig_const.RiggerConstants.ATTR_JOINT_DRIVEN_UUID, obj_type="joint"
-    )
+    driven_jnt = _get_cached_lookup(("driven_joint", uuid_string))
+    if not driven_jnt:
+        driven_jnt = core_uuid.get_object_from_uuid_attr(
+            uuid_string=uuid_string, attr_name=tools_rig_const.RiggerConstants.ATTR_JOINT_DRIVEN_UUID, obj_type="joint"
+        )
     if not driven_jnt:
         source_jnt = find_joint_from_uuid(uuid_string)
         if not source_jnt:
@@ -733,6 +860,7 @@ def get_driven_joint(uuid_string, suffix=core_naming.NamingConstants.Suffix.DRIV
         if constraint_to_source:
             constraint = cmds.parentConstraint(source_jnt, driven_jnt)
             cmds.setAttr(f"{constraint[0]}.interpType", 0)  # Set to No Flip
+    _set_cached_lookup(("driven_joint", uuid_string), driven_jnt)
     return driven_jnt
 
 
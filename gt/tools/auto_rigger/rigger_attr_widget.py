@@ -895,15 +895,20 @@ class AttrWidget(ui_qt.QtWidgets.QWidget):
             combobox.setCurrentIndex(combobox.count() - 1)  # Last item, which was just added
         return combobox
 
-    def call_parent_refresh(self):
+    def call_parent_refresh(self, modules=None):
         """
         Calls the refresh parent function. This function needs to first be set before it can be used.
         In case it has not been set, or it's missing, the operation will be ignored.
+        Args:
+            modules (list, optional): If provided, it's forwarded to the refresh function, so only these are updated.
         """
         if not self.refresh_parent_func or not callable(self.refresh_parent_func):
             logger.debug(f"Unable to call refresh tree function. Function has not been set or is missing.")
             return
-        self.refresh_parent_func()
+        if modules:
+            self.refresh_parent_func(modules=modules)
+        else:
+            self.refresh_parent_func()
 
     def delete_proxy(self, proxy):
         _proxy_name = proxy.get_name()
@@ -948,7 +953,7 @@ class AttrWidget(ui_qt.QtWidgets.QWidget):
         new_name = self.mod_name_field.text() or ""
         self.module.set_name(new_name)
         self.refresh_current_widgets()
-        self.call_parent_refresh()
+        self.call_parent_refresh(modules=[self.module])  # Only the name changed, no need to rebuild the tree
 
     def set_module_prefix(self):
         """
@@ -22,25 +22,50 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
+# Module class to attribute widget (Subclasses use the widget of their closest listed base class)
+_MODULE_ATTR_WIDGETS = {
+    tools_rig_modules.RigModules.ModuleSpine: tools_rig_attr_widget.AttrWidgetModuleSpine,
+    tools_rig_modules.RigModules.ModuleBipedArm: tools_rig_attr_widget.AttrWidgetModuleBipedArm,
+    tools_rig_modules.RigModules.ModuleBipedFingers: tools_rig_attr_widget.AttrWidgetModuleBipedFinger,
+}
+
+_FORMATTED_MENU_NAMES = {}  # Menu name to its formatted version (e.g. "BipedArm": "Biped Arm"), filled on first use
+
+
+def _get_formatted_menu_name(name):
+    """
+    Gets the formatted (camel case split) version of a template or module name. Formatted only once per session.
+    Args:
+        name (str): Name to format. e.g. "BipedArm"
+    Returns:
+        str: Formatted name. e.g. "Biped Arm"
+    """
+    formatted_name = _FORMATTED_MENU_NAMES.get(name)
+    if formatted_name is None:
+        formatted_name = " ".join(core_str.camel_case_split(name))
+        _FORMATTED_MENU_NAMES[name] = formatted_name
+    return formatted_name
+
+
 def get_module_attr_widgets(module):
     """
     Gets the associated attribute widget used to populate the attribute editor in the main UI.
     Returns:
         ModuleAttrWidget: Widget used to populate the attribute editor of the rigger window.
     """
-    if type(module) is tools_rig_modules.RigModules.ModuleGeneric:
+    module_type = type(module)
+    if module_type is tools_rig_modules.RigModules.ModuleGeneric:
         return tools_rig_attr_widget.AttrWidgetModuleGeneric
-    if isinstance(module, tools_rig_modules.RigModules.ModuleSpine):
-        return tools_rig_attr_widget.AttrWidgetModuleSpine
-    if isinstance(module, tools_rig_modules.RigModules.ModuleBipedArm):
-        return tools_rig_attr_widget.AttrWidgetModuleBipedArm
-    if isinstance(module, tools_rig_modules.RigModules.ModuleBipedFingers):
-        return tools_rig_attr_widget.AttrWidgetModuleBipedFinger
-    else:
-        return tools_rig_attr_widget.AttrWidgetCommon
+    for module_class in module_type.__mro__:
+        widget_class = _MODULE_ATTR_WIDGETS.get(module_class)
+        if widget_class:
+            return widget_class
+    return tools_rig_attr_widget.AttrWidgetCommon
 
 
 class RiggerController:
+    _TEMPLATE_MENU_ITEMS = None  # List of (formatted name, template function) tuples, collected on first use
+
     def __init__(self, model, view):
         """
         Initialize the RiggerController object.
@@ -52,6 +77,8 @@ class RiggerController:
         self.model = model
         self.view = view
         self.view.controller = self
+        self.module_tree_items = {}  # Module to its tree item, updated by "populate_module_tree"
+        self._icon_cache = {}  # Icon path to its QIcon, filled by "_get_icon"
 
         self.populate_module_tree()
 
@@ -68,19 +95,33 @@ class RiggerController:
         # Show
         self.view.show()
 
+    def _get_icon(self, icon_path):
+        """
+        Gets a QIcon for the provided path. Icons are created (read from disk) only once and then reused.
+        Args:
+            icon_path (str): Path to the icon file.
+        Returns:
+            QIcon: The icon for the provided path.
+        """
+        icon = self._icon_cache.get(icon_path)
+        if icon is None:
+            icon = ui_qt.QtGui.QIcon(icon_path)
+            self._icon_cache[icon_path] = icon
+        return icon
+
     # ------------------------------------------- Top Menu -------------------------------------------
     def add_menu_file(self):
         """
         Adds a menu bar to the view
         """
         menu_file = self.view.add_menu_parent("File")
-        action_new = ui_qt.QtLib.QtGui.QAction("New Project", icon=ui_qt.QtGui.QIcon(ui_res_lib.Icon.ui_new))
+        action_new = ui_qt.QtLib.QtGui.QAction("New Project", icon=self._get_icon(ui_res_lib.Icon.ui_new))
         action_new.triggered.connect(self.initialize_new_project)
 
-        action_open = ui_qt.QtLib.QtGui.QAction("Open Project", icon=ui_qt.QtGui.QIcon(ui_res_lib.Icon.ui_open))
+        action_open = ui_qt.QtLib.QtGui.QAction("Open Project", icon=self._get_icon(ui_res_lib.Icon.ui_open))
         action_open.triggered.connect(self.load_project_from_file)
 
-        action_save = ui_qt.QtLib.QtGui.QAction("Save Project", icon=ui_qt.QtGui.QIcon(ui_res_lib.Icon.ui_save))
+        action_save = ui_qt.QtLib.QtGui.QAction("Save Project", icon=self._get_icon(ui_res_lib.Icon.ui_save))
         action_save.triggered.connect(self.save_project_to_file)
 
         # Menu Assembly -------------------------------------------------------------------------------------
@@ -89,12 +130,16 @@ class RiggerController:
         self.view.add_menu_action(parent_menu=menu_file, action=action_save)
         # Templates
         menu_templates = self.view.add_menu_submenu(
-            parent_menu=menu_file, submenu_name="Templates", icon=ui_qt.QtGui.QIcon(ui_res_lib.Icon.ui_templates)
+            parent_menu=menu_file, submenu_name="Templates", icon=self._get_icon(ui_res_lib.Icon.ui_templates)
         )
-        for name, template_func in tools_rig_templates.RigTemplates.get_dict_templates().items():
-            formatted_name = " ".join(core_str.camel_case_split(name))
+        if RiggerController._TEMPLATE_MENU_ITEMS is None:
+            RiggerController._TEMPLATE_MENU_ITEMS = [
+                (_get_formatted_menu_name(name), template_func)
+                for name, template_func in tools_rig_templates.RigTemplates.get_dict_templates().items()
+            ]
+        for formatted_name, template_func in RiggerController._TEMPLATE_MENU_ITEMS:
             action_template = ui_qt.QtLib.QtGui.QAction(
-                formatted_name, icon=ui_qt.QtGui.QIcon(ui_res_lib.Icon.rigger_template_biped)
+                formatted_name, icon=self._get_icon(ui_res_lib.Icon.rigger_template_biped)
             )
             item_func = partial(self.replace_project, project=template_func)
             action_template.triggered.connect(item_func)
@@ -112,13 +157,13 @@ class RiggerController:
             _icon_path = known_categories.get(name, None)
 
             menu_templates = self.view.add_menu_submenu(
-                parent_menu=menu_modules, submenu_name=name, icon=ui_qt.QtGui.QIcon(_icon_path)
+                parent_menu=menu_modules, submenu_name=name, icon=self._get_icon(_icon_path)
             )
             if isinstance(module_name, list):
                 for unique_mod in module_name:
                     module_list = RigModulesCategories.unique_modules.get(unique_mod)
-                    formatted_name = " ".join(core_str.camel_case_split(unique_mod))
-                    action_mod = ui_qt.QtLib.QtGui.QAction(formatted_name, icon=ui_qt.QtGui.QIcon(module_list[0].icon))
+                    formatted_name = _get_formatted_menu_name(unique_mod)
+                    action_mod = ui_qt.QtLib.QtGui.QAction(formatted_name, icon=self._get_icon(module_list[0].icon))
                     item_func = partial(
                         self.add_module_to_project_from_list, module_name=formatted_name, module_list=module_list
                     )
@@ -155,7 +200,7 @@ class RiggerController:
         message_box.setWindowTitle(f'Which "{str(module_name)}" Module?')
         message_box.setText(f'Which variation of "{str(module_name)}"\nwould like to add?')
 
-        question_icon = ui_qt.QtGui.QIcon(module_list[0].icon)
+        question_icon = self._get_icon(module_list[0].icon)
         message_box.setIconPixmap(question_icon.pixmap(64, 64))
         for mod in module_list:
             formatted_name = core_str.remove_prefix(input_string=str(mod.__name__), prefix="Module")
@@ -218,45 +263,59 @@ class RiggerController:
 
     # ----------------------------------------- Modules Tree -----------------------------------------
     def populate_module_tree(self):
+        """
+        Clears and repopulates the modules tree using the modules of the current project. (Full rebuild)
+        """
+        self.view.module_tree.setUpdatesEnabled(False)  # Single repaint after all items are added and re-parented
+        try:
+            self._populate_module_tree()
+        finally:
+            self.view.module_tree.setUpdatesEnabled(True)
+
+    def _populate_module_tree(self):
+        """
+        Clears and repopulates the modules tree. Use "populate_module_tree" instead, as it suspends repaints.
+        """
         self.view.clear_module_tree()
 
         project = self.model.get_project()
-        icon_project = ui_qt.QtGui.QIcon(project.icon)
+        icon_project = self._get_icon(project.icon)
         project_item = ui_tree_enhanced.QTreeItemEnhanced([project.get_name()])
         project_item.setIcon(0, icon_project)
         project_item.setData(1, 0, project)
         project_item.setFlags(project_item.flags() & ~ui_qt.QtLib.ItemFlag.ItemIsDragEnabled)
-        self.view.add_item_to_module_tree(project_item)
         self.view.module_tree.set_drop_callback(self.on_drop_tree_module_item)
 
         modules = self.model.get_modules()
         tree_item_dict = {}
         for module in modules:
-            icon = ui_qt.QtGui.QIcon(module.icon)
+            icon = self._get_icon(module.icon)
             module_type = module.get_description_name()
             tree_item = ui_tree_enhanced.QTreeItemEnhanced([module_type])
             tree_item.setIcon(0, icon)
             tree_item.setData(1, 0, module)
-            project_item.addChild(tree_item)
             tree_item_dict[module] = tree_item
             tree_item.set_allow_parenting(state=module.allow_parenting)
             if not module.is_active():
                 tree_item.setForeground(0, ui_qt.QtGui.QColor(ui_res_lib.Color.Hex.gray_dim))
 
-        # Create Hierarchy
-        for module, tree_item in reversed(list(tree_item_dict.items())):
+        # Create Hierarchy (Items are still detached, children are added in bulk, keeping the modules order)
+        modules_by_uuid = project.get_modules_by_proxy_uuid()
+        children_of = {None: []}  # Parent module to its children items (None = project)
+        for module, tree_item in tree_item_dict.items():
+            parent_module = None
             parent_proxy_uuid = module.get_parent_uuid()
-            if not parent_proxy_uuid or not isinstance(parent_proxy_uuid, str):
-                continue
-            parent_module = project.get_module_from_proxy_uuid(parent_proxy_uuid)
-            if module == parent_module:
-                continue
-            parent_tree_item = tree_item_dict.get(parent_module)
-            if parent_tree_item:
-                index = project_item.indexOfChild(tree_item)
-                child_item = project_item.takeChild(index)
-                parent_tree_item.insertChild(0, child_item)
+            if parent_proxy_uuid and isinstance(parent_proxy_uuid, str):
+                parent_module = modules_by_uuid.get(parent_proxy_uuid)
+                if module == parent_module or parent_module not in tree_item_dict:
+                    parent_module = None
+            children_of.setdefault(parent_module, []).append(tree_item)
+        for parent_module, child_items in children_of.items():
+            parent_tree_item = tree_item_dict.get(parent_module, project_item)
+            parent_tree_item.addChildren(child_items)
+        self.view.add_item_to_module_tree(project_item)
 
+        self.module_tree_items = tree_item_dict
         self.view.expand_all_module_tree_items()
 
     def update_modules_order(self):
@@ -301,10 +360,18 @@ class RiggerController:
         self.on_tree_item_clicked(item=self.view.module_tree.currentItem())  # Refresh Widget
 
     # ------------------------------------------- General --------------------------------------------
-    def refresh_widgets(self):
+    def refresh_widgets(self, modules=None):
         """
         Refreshes widgets
+        Args:
+            modules (list, optional): If provided, only the tree items of these modules have their names updated.
+                                      Used when only the name of the modules changed. If any of them is not in the
+                                      tree, or when not provided, the whole tree is rebuilt.
         """
+        if modules and all(module in self.module_tree_items for module in modules):
+            for module in modules:
+                self.module_tree_items.get(module).setText(0, module.get_description_name())
+            return
         self.populate_module_tree()
 
     def on_tree_item_clicked(self, item, *kwargs):
@@ -342,6 +409,8 @@ class RiggerController:
             bool: True if operation was cancelled or an issue was detected.
                   False if operation is ready to proceed.
         """
+        import maya.cmds as cmds
+
         # Existing Proxy ------------------------------------------------------------------------
         proxy_grp = tools_rig_utils.find_root_group_proxy()
         if proxy_grp:
@@ -352,16 +421,12 @@ class RiggerController:
             message_box.addButton("Ignore Changes and Rebuild", ui_qt.QtLib.ButtonRoles.ActionRole)
             message_box.addButton("Read Changes and Rebuild", ui_qt.QtLib.ButtonRoles.ActionRole)
             message_box.addButton("Cancel", ui_qt.QtLib.ButtonRoles.RejectRole)
-            question_icon = ui_qt.QtGui.QIcon(ui_res_lib.Icon.ui_exclamation)
+            question_icon = self._get_icon(ui_res_lib.Icon.ui_exclamation)
             message_box.setIconPixmap(question_icon.pixmap(64, 64))
             result = message_box.exec_()
             if result == 0:
-                import maya.cmds as cmds
-
                 cmds.delete(proxy_grp)
             elif result == 1:
-                import maya.cmds as cmds
-
                 self.model.get_project().read_data_from_scene()
                 cmds.delete(proxy_grp)
             else:
@@ -376,16 +441,12 @@ class RiggerController:
             message_box.addButton("Delete Current and Rebuild", ui_qt.QtLib.ButtonRoles.ActionRole)
             message_box.addButton("Unpack Geometries and Rebuild", ui_qt.QtLib.ButtonRoles.ActionRole)
             message_box.addButton("Cancel", ui_qt.QtLib.ButtonRoles.ActionRole)
-            question_icon = ui_qt.QtGui.QIcon(ui_res_lib.Icon.ui_exclamation)
+            question_icon = self._get_icon(ui_res_lib.Icon.ui_exclamation)
             message_box.setIconPixmap(question_icon.pixmap(64, 64))
             result = message_box.exec_()
             if result == 0:
-                import maya.cmds as cmds
-
                 cmds.delete(rig_grp)
             elif result == 1:
-                import maya.cmds as cmds
-
                 print("unpack here")  # TODO @@@
                 cmds.delete(rig_grp)
             else:
@@ -24,16 +24,13 @@
  Updated preferences system to use package variables instead of maya option vars
  Made tool dockable
 """
-from gt.tools.package_updater import package_updater_controller
 from gt.tools.package_updater import package_updater_model
-from gt.tools.package_updater import package_updater_view
-from gt.ui import qt_utils
-import threading
+import gt.core.version as core_version
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 # Logging Setup
 
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
@@ -42,14 +39,47 @@ __version_tuple__ = (2, 0, 5)
 __version_suffix__ = ''
 __version__ = '.'.join(str(n) for n in __version_tuple__) + __version_suffix__
 
+_ACTIVE_VIEW = None  # Last updater window created, reused while it's still open
+# Single background worker shared by silent checks (threads are only created on first submit)
+_UPDATE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gt-updater")
+_SILENT_CHECK_RAN = False  # Silent checks only run once per session
+
+
+def _get_visible_view():
+    """
+    Gets the package updater window if it's currently open.
+    Returns:
+        PackageUpdaterView or None: The open updater window, None if no window is visible.
+    """
+    try:
+        if _ACTIVE_VIEW is not None and _ACTIVE_VIEW.isVisible():
+            return _ACTIVE_VIEW
+    except RuntimeError:  # Underlying Qt object was already deleted
+        pass
+    return None
+
 
 def build_package_updater_gui(model=None):
     """
     Creates Model, View and Controller
+    If an updater window is already open, it's brought to the front instead of creating a duplicate.
     Args:
         model (PackageUpdaterModel, optional): If provided, the function will use the existing model
                                                instead of creating a new one, thus using the existing request data.
+    Returns:
+        PackageUpdaterView: The updater window (new or existing)
     """
+    global _ACTIVE_VIEW
+    _visible_view = _get_visible_view()
+    if _visible_view is not None:
+        _visible_view.raise_()
+        return _visible_view
+
+    # View and controller are only needed once the window is shown (silent checks skip them)
+    from gt.tools.package_updater import package_updater_controller
+    from gt.tools.package_updater import package_updater_view
+    from gt.ui import qt_utils
+
     # Determine Parent
     # _standalone = session_utils.is_script_in_py_maya()
     with qt_utils.QtApplicationContext() as context:
@@ -58,33 +88,56 @@ def build_package_updater_gui(model=None):
             _model = model
         else:
             _model = package_updater_model.PackageUpdaterModel()
+        _ACTIVE_VIEW = _view
         _controller = package_updater_controller.PackageUpdaterController(model=_model, view=_view)
+    return _view
 
 
 def silently_check_for_updates():
+    """
+    Checks for updates in the background (when auto check is active and the interval has passed).
+    If an update is available, the package updater window is opened. Only runs once per session.
+    """
+    global _SILENT_CHECK_RAN
+    if _SILENT_CHECK_RAN:
+        logger.debug("Silent update check already ran in this session. Skipped duplicate request.")
+        return
+    _SILENT_CHECK_RAN = True
     _model = package_updater_model.PackageUpdaterModel()
     if not _model.get_auto_check():
         return
     if not _model.is_time_to_update():
         return
 
-    def _initialize_tool_if_updating():
+    # Reading the installed version queries Maya, so it happens here (main thread) and not in the worker
+    _installed_version = core_version.get_installed_version()
+    if not _installed_version:
+        return
+
+    def _open_updater_if_needed():
         """
-        Internal function to check if an update is available, if it is, open package updater
-        This function takes a little longer because it makes a request. It should always run as a thread.
+        Internal function that runs in Maya's main thread once the update data was retrieved.
+        Saves the check date and opens the package updater if an update is available.
         """
-        _model.check_for_updates()
         _model.save_last_check_date_as_now()
         if _model.is_update_needed():
             build_package_updater_gui(model=_model)
 
     def _maya_retrieve_update_data():
-        """ Internal function used to check for updates using threads in Maya """
+        """
+        Internal function that retrieves the update data in the worker thread (web request and parsing only).
+        Everything else is deferred back to Maya's main thread.
+        """
+        try:
+            _model.check_for_updates(installed_version=_installed_version)
+        except Exception as e:
+            logger.debug(f'Unable to silently check for updates. Issue: {e}')
+            return
         from gt.utils.system import execute_deferred
-        execute_deferred(_initialize_tool_if_updating)
+        execute_deferred(_open_updater_if_needed)
+
     try:
-        thread = threading.Thread(None, target=_maya_retrieve_update_data)
-        thread.start()
+        _UPDATE_EXECUTOR.submit(_maya_retrieve_update_data)
     except Exception as e:
         logger.debug(f'Unable to silently check for updates. Issue: {e}')
 
@@ -98,5 +151,6 @@ def launch_tool():
 
 
 if __name__ == "__main__":
+    logging.basicConfig()
     logger.setLevel(logging.DEBUG)
     launch_tool()
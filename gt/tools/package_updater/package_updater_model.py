@@ -6,8 +6,8 @@ Classes:
 """
 
 from gt.core.setup import remove_package_loaded_modules, reload_package_loaded_modules
-from gt.utils.request import download_file, is_connected_to_internet
-from gt.core.io import unzip_zip_file, delete_paths
+from gt.utils.request import download_file, is_connected_to_internet, http_get_request, get_http_response_type
+from gt.core.io import unzip_zip_file, delete_paths, read_data
 from gt.core.setup import PACKAGE_MAIN_MODULE
 import gt.ui.resource_library as ui_res_lib
 import gt.core.version as core_version
@@ -18,6 +18,7 @@ from gt.ui import progress_bar
 from datetime import datetime
 from json import loads
 import logging
+import time
 import sys
 import os
 
@@ -31,6 +32,32 @@ PREFS_NAME = "package_updater"
 PREFS_LAST_DATE = "last_date"  # Format: '2020-01-01 17:08:00'
 PREFS_AUTO_CHECK = "auto_check"
 PREFS_INTERVAL_DAYS = "interval_days"
+MIN_INTERVAL_DAYS = 1  # Shortest interval between automatic checks
+PREFS_CACHED_URL = "cached_url"  # URL of the cached response (the validators below belong to it)
+PREFS_ETAG = "etag"  # "ETag" header of the cached response
+PREFS_LAST_MODIFIED = "last_modified"  # "Last-Modified" header of the cached response
+PREFS_FETCHED_AT = "fetched_at"  # Time (seconds since epoch) when the cached response was last validated
+PREFS_MAX_AGE = "max_age"  # "Cache-Control" max-age (seconds) of the cached response
+CACHED_RESPONSE_FILE = "cached_response.json"  # User file (prefs sub-folder) storing the cached response content
+
+
+def _get_max_age(cache_control):
+    """
+    Gets the "max-age" directive from a "Cache-Control" header value.
+    Args:
+        cache_control (str, None): Header value. e.g. "public, max-age=60, s-maxage=60"
+    Returns:
+        int: The max-age in seconds. Zero (0) when missing or when the response should not be reused. e.g. "no-cache"
+    """
+    max_age = 0
+    for directive in (cache_control or "").split(","):
+        name, _, value = directive.strip().partition("=")
+        name = name.lower()
+        if name in ("no-cache", "no-store"):
+            return 0
+        if name == "max-age" and value.isdigit():
+            max_age = int(value)
+    return max_age
 
 
 class PackageUpdaterModel:
@@ -112,11 +139,12 @@ class PackageUpdaterModel:
         """
         Set the interval in days.
         Args:
-            interval_days (int): The new interval in days.
+            interval_days (int): The new interval in days. Minimum is one (1) day, lower values are clamped to it.
         """
-        if not isinstance(interval_days, int):
+        if not isinstance(interval_days, int) or isinstance(interval_days, bool):
             logger.warning(f'Unable to set "Interval Days". Incorrect data type. (Must be int)')
-        self.interval_days = interval_days
+            return
+        self.interval_days = max(interval_days, MIN_INTERVAL_DAYS)
 
     def save_last_check_date_as_now(self):
         """
@@ -185,6 +213,7 @@ class PackageUpdaterModel:
             last_check_date = datetime.strptime(self.last_date, "%Y-%m-%d %H:%M:%S")
         except Exception as e:
             logger.debug(str(e))
+            return True  # Unknown last check date
 
         # Calculate Delta
         delta = today_date - last_check_date
@@ -248,21 +277,97 @@ class PackageUpdaterModel:
         """
         return self.needs_update
 
+    def _cached_get(self, url):
+        """
+        Makes a conditional HTTP GET request using the validators ("ETag"/"Last-Modified") of the previous response.
+        If the content didn't change (304 - Not Modified), the cached content is returned instead of downloading it.
+        Successful responses (and their validators) are cached for the next request.
+        Args:
+            url (str): URL to request. e.g. "https://api.github.com/repos/**USER**/**REPO**/releases"
+        Returns:
+            tuple: A tuple with (HTTPResponse, response content). Same as "http_get_request".
+        """
+        headers = {}
+        cached_file = None
+        if self.preferences.get_string(key=PREFS_CACHED_URL) == url:
+            cached_file = self.preferences.get_user_file(CACHED_RESPONSE_FILE)
+        if cached_file and self._is_fresh():  # Still fresh ("Cache-Control" max-age), no request needed
+            return None, read_data(cached_file)
+        if cached_file:
+            etag = self.preferences.get_string(key=PREFS_ETAG)
+            last_modified = self.preferences.get_string(key=PREFS_LAST_MODIFIED)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        response, response_content = http_get_request(url, headers=headers, keep_alive=True)
+        if not response:
+            return response, response_content
+        if response.status == 304 and cached_file:
+            self._save_freshness(response)  # Cached content validated, it's fresh again
+            self.preferences.save()
+            return response, read_data(cached_file)
+        if get_http_response_type(response.status) == "successful" and response_content:
+            self.preferences.write_user_file(file_name=CACHED_RESPONSE_FILE, content=response_content)
+            self.preferences.set_string(key=PREFS_CACHED_URL, value=url)
+            self.preferences.set_string(key=PREFS_ETAG, value=response.getheader("ETag") or "")
+            self.preferences.set_string(key=PREFS_LAST_MODIFIED, value=response.getheader("Last-Modified") or "")
+            self._save_freshness(response)
+            self.preferences.save()
+        elif get_http_response_type(response.status) != "successful":
+            logger.debug(f'HTTP response returned unsuccessful status code. URL: "{url}" (Status: {response.status})')
+            response_content = None
+        return response, response_content
+
+    def _save_freshness(self, response):
+        """
+        Stores when a response was received along with its "Cache-Control" max-age. (Not saved to disk)
+        Args:
+            response (HTTPResponse): A response received from the "_cached_get" request.
+        """
+        self.preferences.set_float(key=PREFS_FETCHED_AT, value=time.time())
+        self.preferences.set_int(key=PREFS_MAX_AGE, value=_get_max_age(response.getheader("Cache-Control")))
+
+    def _is_fresh(self):
+        """
+        Checks if the cached response is still fresh according to its "Cache-Control" max-age.
+        Returns:
+            bool: True if the cached response can be reused without a request, False otherwise.
+        """
+        fetched_at = self.preferences.get_float(key=PREFS_FETCHED_AT, default=0.0)
+        max_age = self.preferences.get_int(key=PREFS_MAX_AGE, default=0)
+        return 0 <= time.time() - fetched_at < max_age
+
     def request_github_data(self):
         """Requests GitHub data and updates the requested online data status"""
-        response, response_content = core_version.get_github_releases()
+        response, response_content = self._cached_get(core_version.PACKAGE_RELEASES_URL)
         self.response_content = response_content
         if response:
             self.web_response_code = response.status
             self.web_response_reason = response.reason
             self.requested_online_data = True
+        elif response_content:  # Fresh cached response, no request was made
+            self.web_response_reason = "OK (Cached)"
+            self.requested_online_data = True
 
-    def check_for_updates(self):
-        """Checks current version against web version and updates stored values with retrieved data"""
+    def check_for_updates(self, installed_version=None):
+        """
+        Checks current version against web version and updates stored values with retrieved data
+        Args:
+            installed_version (str, optional): Installed version to compare against. e.g. "1.2.3"
+                                               If not provided, it's read from the installation, which queries Maya.
+                                               Callers running this function outside the main thread must read it
+                                               beforehand (in the main thread) and provide it here.
+        """
         # Current Version
-        self.installed_version = core_version.get_installed_version()
-        if not is_connected_to_internet(server="github.com", port=80):
-            logger.debug('Unable to request online data. Failed to connect to "github.com".')
+        if installed_version is None:
+            installed_version = core_version.get_installed_version()
+        self.installed_version = installed_version
+        # Connection probe is only needed when the cached releases can't be reused without a request
+        is_cache_fresh = self.preferences.get_string(key=PREFS_CACHED_URL) == core_version.PACKAGE_RELEASES_URL
+        is_cache_fresh = is_cache_fresh and self._is_fresh()
+        if not is_cache_fresh and not is_connected_to_internet(server="api.github.com", port=443):
+            logger.debug('Unable to request online data. Failed to connect to "api.github.com".')
             return
         # Latest Version
         self.request_github_data()
@@ -336,6 +441,7 @@ class PackageUpdaterModel:
             logger.warning(f'Unable to update. Failed to interpret content data. Issue: "{str(e)}".')
             return
 
+        app = None
         if not ui_qt.QtWidgets.QApplication.instance():
             app = ui_qt.QtWidgets.QApplication(sys.argv)
 
@@ -466,11 +572,8 @@ class PackageUpdaterModel:
         self.installed_version = self.latest_github_version
         self.refresh_status_description()
 
-        if ui_qt.QtWidgets.QApplication.instance():
-            try:
-                sys.exit(app.exec_())
-            except Exception as e:
-                logger.debug(e)
+        if app:  # Standalone (application created here), keeps window open and returns once it's closed
+            app.exec_()
         return self.progress_win
 
 
@@ -99,68 +99,38 @@ gt_renamer_settings = {
 # Store Default Values for Resetting
 gt_renamer_settings_default_values = copy.deepcopy(gt_renamer_settings)
 
+# Persistent Settings (optionVar name: settings key)
+_SETTINGS_OPTION_VARS = {
+    "gt_renamer_transform_suffix": "transform_suffix",
+    "gt_renamer_mesh_suffix": "mesh_suffix",
+    "gt_renamer_nurbs_curve_suffix": "nurbs_crv_suffix",
+    "gt_renamer_joint_suffix": "joint_suffix",
+    "gt_renamer_locator_suffix": "locator_suffix",
+    "gt_renamer_surface_suffix": "surface_suffix",
+    "gt_renamer_left_prefix": "left_prefix",
+    "gt_renamer_right_prefix": "right_prefix",
+    "gt_renamer_center_prefix": "center_prefix",
+    "gt_renamer_def_starting_number": "def_starting_number",
+    "gt_renamer_def_padding_number": "def_padding_number",
+    "gt_renamer_selection_type": "selection_type",
+    "gt_renamer_def_uppercase_letter": "def_uppercase_letter",
+}
+
 
 def get_persistent_settings_renamer():
     """
     Checks if persistent settings for GT Renamer exists and transfer them to the settings variables.
     It assumes that persistent settings were stored using the cmds.optionVar function.
     """
-    stored_transform_suffix_exists = cmds.optionVar(exists="gt_renamer_transform_suffix")
-    stored_mesh_suffix_exists = cmds.optionVar(exists="gt_renamer_mesh_suffix")
-    stored_nurbs_crv_suffix_exists = cmds.optionVar(exists="gt_renamer_nurbs_curve_suffix")
-    stored_joint_suffix_exists = cmds.optionVar(exists="gt_renamer_joint_suffix")
-    stored_locator_suffix_exists = cmds.optionVar(exists="gt_renamer_locator_suffix")
-    stored_surface_suffix_exists = cmds.optionVar(exists="gt_renamer_surface_suffix")
-    stored_left_prefix_exists = cmds.optionVar(exists="gt_renamer_left_prefix")
-    stored_right_prefix_exists = cmds.optionVar(exists="gt_renamer_right_prefix")
-    stored_center_prefix_exists = cmds.optionVar(exists="gt_renamer_center_prefix")
-    stored_def_starting_number_exists = cmds.optionVar(exists="gt_renamer_def_starting_number")
-    stored_def_padding_number_exists = cmds.optionVar(exists="gt_renamer_def_padding_number")
-    stored_selection_type_exists = cmds.optionVar(exists="gt_renamer_selection_type")
-    stored_def_capitalize_exists = cmds.optionVar(exists="gt_renamer_def_uppercase_letter")
-
-    if stored_transform_suffix_exists:
-        gt_renamer_settings["transform_suffix"] = str(cmds.optionVar(q="gt_renamer_transform_suffix"))
-
-    if stored_mesh_suffix_exists:
-        gt_renamer_settings["mesh_suffix"] = str(cmds.optionVar(q="gt_renamer_mesh_suffix"))
-
-    if stored_nurbs_crv_suffix_exists:
-        gt_renamer_settings["nurbs_crv_suffix"] = str(cmds.optionVar(q="gt_renamer_nurbs_curve_suffix"))
-
-    if stored_joint_suffix_exists:
-        gt_renamer_settings["joint_suffix"] = str(cmds.optionVar(q="gt_renamer_joint_suffix"))
-
-    if stored_locator_suffix_exists:
-        gt_renamer_settings["locator_suffix"] = str(cmds.optionVar(q="gt_renamer_locator_suffix"))
-
-    if stored_surface_suffix_exists:
-        gt_renamer_settings["surface_suffix"] = str(cmds.optionVar(q="gt_renamer_surface_suffix"))
-
-    if stored_left_prefix_exists:
-        gt_renamer_settings["left_prefix"] = str(cmds.optionVar(q="gt_renamer_left_prefix"))
-
-    if stored_right_prefix_exists:
-        gt_renamer_settings["right_prefix"] = str(cmds.optionVar(q="gt_renamer_right_prefix"))
-
-    if stored_center_prefix_exists:
-        gt_renamer_settings["center_prefix"] = str(cmds.optionVar(q="gt_renamer_center_prefix"))
-
-    if stored_def_starting_number_exists:
-        gt_renamer_settings["def_starting_number"] = str(cmds.optionVar(q="gt_renamer_def_starting_number"))
-
-    if stored_def_padding_number_exists:
-        gt_renamer_settings["def_padding_number"] = str(cmds.optionVar(q="gt_renamer_def_padding_number"))
-
-    if stored_selection_type_exists:
-        gt_renamer_settings["selection_type"] = str(cmds.optionVar(q="gt_renamer_selection_type"))
-
-    if stored_def_capitalize_exists:
-        extracted_value = cmds.optionVar(q="gt_renamer_def_uppercase_letter") or ""
-        if "False" in extracted_value:
-            gt_renamer_settings["def_uppercase_letter"] = "0"
+    existing_option_vars = set(cmds.optionVar(list=True) or [])
+    for option_var, settings_key in _SETTINGS_OPTION_VARS.items():
+        if option_var not in existing_option_vars:
+            continue
+        if settings_key == "def_uppercase_letter":
+            extracted_value = cmds.optionVar(q=option_var) or ""
+            gt_renamer_settings[settings_key] = "0" if "False" in extracted_value else "1"
         else:
-            gt_renamer_settings["def_uppercase_letter"] = "1"
+            gt_renamer_settings[settings_key] = str(cmds.optionVar(q=option_var))
 
 
 def set_persistent_settings_renamer(option_var_name, option_var_string):
@@ -181,24 +151,11 @@ def set_persistent_settings_renamer(option_var_name, option_var_string):
 
 def reset_persistent_settings_renamer():
     """Resets persistent settings for GT Renamer"""
-    cmds.optionVar(remove="gt_renamer_transform_suffix")
-    cmds.optionVar(remove="gt_renamer_mesh_suffix")
-    cmds.optionVar(remove="gt_renamer_nurbs_curve_suffix")
-    cmds.optionVar(remove="gt_renamer_joint_suffix")
-    cmds.optionVar(remove="gt_renamer_locator_suffix")
-    cmds.optionVar(remove="gt_renamer_surface_suffix")
-    cmds.optionVar(remove="gt_renamer_left_prefix")
-    cmds.optionVar(remove="gt_renamer_right_prefix")
-    cmds.optionVar(remove="gt_renamer_center_prefix")
-    cmds.optionVar(remove="gt_renamer_def_starting_number")
-    cmds.optionVar(remove="gt_renamer_def_padding_number")
-    cmds.optionVar(remove="gt_renamer_def_uppercase_letter")
-    cmds.optionVar(remove="gt_renamer_selection_type")
-
-    for def_value in gt_renamer_settings_default_values:
-        for value in gt_renamer_settings:
-            if def_value == value:
-                gt_renamer_settings[value] = gt_renamer_settings_default_values[def_value]
+    for option_var in _SETTINGS_OPTION_VARS:
+        cmds.optionVar(remove=option_var)
+
+    # Copied, so the active settings never share the default lists (e.g. "nodes_to_ignore")
+    gt_renamer_settings.update(copy.deepcopy(gt_renamer_settings_default_values))
 
     get_persistent_settings_renamer()
     build_gui_renamer()
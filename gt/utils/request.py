@@ -11,6 +11,7 @@ from gt.core.str import remove_strings_from_string
 import http.client as http_client
 import urllib.request
 import webbrowser
+import threading
 import logging
 
 # Logging Setup
@@ -18,6 +19,9 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+_KEEP_ALIVE_CONNECTIONS = {}  # Host -> open "HTTPSConnection" reused by "keep_alive" requests
+_KEEP_ALIVE_LOCK = threading.Lock()
+
 
 def parse_http_request_url(url):
     """
@@ -43,7 +47,62 @@ def parse_http_request_url(url):
     return host_out, repo
 
 
-def http_get_request(url, timeout_ms=2000, host_overwrite=None, path_overwrite=None):
+def _send_get_request(connection, path, headers):
+    """
+    Sends a GET request through the provided connection and reads its response.
+
+    Args:
+        connection (http.client.HTTPSConnection): Connection used to send the request.
+        path (str): Request path. e.g. "/repos/**USER**/**REPO**/releases/latest"
+        headers (dict): Request headers.
+
+    Returns:
+        tuple: A tuple with (HTTPResponse, response content). Content is None if it couldn't be read.
+    """
+    connection.request("GET", path, headers=headers)
+    response = connection.getresponse()
+    response_content = None
+    try:
+        response_content = response.read().decode("utf-8")
+    except Exception as e:
+        logger.debug(f'Failed to read HTTP response. Issue: "{e}".')
+    return response, response_content
+
+
+def _keep_alive_get_request(host, path, headers, timeout_sec):
+    """
+    Sends a GET request reusing the open connection to the host, skipping the handshake of a new connection.
+    If the kept connection was closed by the server in the meantime, a new one is opened and the request sent again.
+
+    Args:
+        host (str): Request host. e.g. "api.github.com"
+        path (str): Request path. e.g. "/repos/**USER**/**REPO**/releases/latest"
+        headers (dict): Request headers.
+        timeout_sec (float): Timeout used when opening a new connection.
+
+    Returns:
+        tuple: A tuple with (HTTPResponse, response content)
+    """
+    response = response_content = None
+    connection = _KEEP_ALIVE_CONNECTIONS.pop(host, None)
+    if connection is not None:
+        try:
+            response, response_content = _send_get_request(connection, path, headers)
+        except (http_client.HTTPException, OSError) as e:
+            logger.debug(f'Kept connection to "{host}" is no longer usable. Reconnecting. Issue: {e}')
+            connection.close()
+            connection = None
+    if connection is None:
+        connection = http_client.HTTPSConnection(host, timeout=timeout_sec)
+        response, response_content = _send_get_request(connection, path, headers)
+    if response.will_close or response_content is None:
+        connection.close()
+    else:
+        _KEEP_ALIVE_CONNECTIONS[host] = connection
+    return response, response_content
+
+
+def http_get_request(url, timeout_ms=2000, host_overwrite=None, path_overwrite=None, headers=None, keep_alive=False):
     """
     Make an HTTP GET request to a REST API and return the response.
 
@@ -54,6 +113,10 @@ def http_get_request(url, timeout_ms=2000, host_overwrite=None, path_overwrite=N
                               If provided, it will replace whatever was parsed out of the URL. Default None (do nothing)
         path_overwrite (str): String for the path overwrite. For example: "/repos/**USER**/**REPO**/releases/latest"
                               If provided, it will replace whatever was parsed out of the URL. Default None (do nothing)
+        headers (dict, optional): Extra request headers. e.g. {"If-None-Match": '"etag"'}
+                                  These are added to (or replace) the default "Content-Type" and "User-Agent" headers.
+        keep_alive (bool, optional): If active, the connection is kept open after the request and reused by the next
+                                     "keep_alive" request to the same host. Default is False (connection is closed)
 
     Returns:
         tuple: A tuple with (HTTPResponse, response content)
@@ -70,16 +133,14 @@ def http_get_request(url, timeout_ms=2000, host_overwrite=None, path_overwrite=N
         if isinstance(path_overwrite, str):
             path = path_overwrite
         timeout_sec = timeout_ms / 1000  # Convert milliseconds to seconds
+        request_headers = {"Content-Type": "application/json; charset=UTF-8", "User-Agent": "packaage_updater"}
+        if headers:
+            request_headers.update(headers)
+        if keep_alive:
+            with _KEEP_ALIVE_LOCK:
+                return _keep_alive_get_request(host, path, request_headers, timeout_sec)
         connection = http_client.HTTPSConnection(host, timeout=timeout_sec)
-        connection.request(
-            "GET", path, headers={"Content-Type": "application/json; charset=UTF-8", "User-Agent": "packaage_updater"}
-        )
-        response = connection.getresponse()
-        response_content = None
-        try:
-            response_content = response.read().decode("utf-8")
-        except Exception as e:
-            logger.debug(f'Failed to read HTTP response. Issue: "{e}".')
+        response, response_content = _send_get_request(connection, path, request_headers)
         connection.close()
         return response, response_content
     except Exception as e:
@@ -213,8 +274,8 @@ def is_connected_to_internet(timeout_ms=1000, server="8.8.8.8", port=53):
     timeout_sec = timeout_ms / 1000.0  # Convert milliseconds to seconds
     try:
         # Create a socket and attempt to connect to Google's DNS server (8.8.8.8) on port 53 (DNS)
-        socket.setdefaulttimeout(timeout_sec)
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(timeout_sec)  # Only this socket, "setdefaulttimeout" would affect the whole process
         sock.connect((server, port))
         sock.close()
         return True